@@ -0,0 +1,249 @@
+"""
+Packed Audio Bank
+Packs every TTS clip into one file: 16-bit mono PCM at a common sample
+rate, a JSON key table and an offsets array keyed by the normalized clip
+name. The reader memory-maps the bank and hands out zero-copy sample
+views, so startup reads only the header and worker processes share one
+copy through the page cache.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+from banjara_tts import CLIP_DIRS, ClipMatcher, iter_clip_files, match_clips
+
+MAGIC = b'BNJA'
+VERSION = 2
+
+# magic, version, channels, sample rate, clip count, key table size,
+# reserved, PCM size in bytes (32 bytes, so the offsets stay 8-byte aligned)
+HEADER = struct.Struct('<4sHHIIIIQ')
+
+SAMPLE_RATE = 48000
+
+_FORMAT_PCM = 1
+_FORMAT_FLOAT = 3
+_FORMAT_EXTENSIBLE = 0xFFFE
+
+def _pad(n):
+    return -n % 8
+
+def read_wav(path):
+    """
+    Read a WAV file as (channels, sample rate, array('h') of interleaved samples)
+    Handles 8/16/24/32-bit PCM and 32/64-bit float, including the
+    WAVE_FORMAT_EXTENSIBLE and JUNK-padded headers the wave module rejects
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        raise ValueError("not a RIFF/WAVE file")
+
+    fmt = pcm = None
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id, size = struct.unpack_from('<4sI', data, pos)
+        body = data[pos + 8:pos + 8 + size]
+        if chunk_id == b'fmt ':
+            fmt = body
+        elif chunk_id == b'data':
+            pcm = body
+        pos += 8 + size + (size & 1)
+    if fmt is None or pcm is None:
+        raise ValueError("fmt or data chunk missing")
+
+    format_tag, channels, rate, _, _, bits = struct.unpack_from('<HHIIHH', fmt)
+    if format_tag == _FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        format_tag = struct.unpack_from('<H', fmt, 24)[0]
+    width = bits // 8
+    pcm = pcm[:len(pcm) - len(pcm) % (width * channels)]
+
+    if format_tag == _FORMAT_FLOAT and width in (4, 8):
+        values = array('f' if width == 4 else 'd', pcm)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        samples = array('h', (max(-32768, min(32767, int(v * 32767))) for v in values))
+    elif format_tag == _FORMAT_PCM and width == 1:
+        samples = array('h', ((v - 128) << 8 for v in pcm))
+    elif format_tag == _FORMAT_PCM and width == 2:
+        samples = array('h', pcm)
+        if sys.byteorder == 'big':
+            samples.byteswap()
+    elif format_tag == _FORMAT_PCM and width in (3, 4):
+        samples = array('h', (int.from_bytes(pcm[i + width - 2:i + width], 'little', signed=True)
+                              for i in range(0, len(pcm), width)))
+    else:
+        raise ValueError(f"unsupported format {format_tag} with {bits}-bit samples")
+    return channels, rate, samples
+
+def to_mono(samples, channels):
+    """Average interleaved channels into one"""
+    if channels == 1:
+        return samples
+    return array('h', (sum(samples[i:i + channels]) // channels
+                       for i in range(0, len(samples), channels)))
+
+def resample(samples, rate, target_rate):
+    """Linear-interpolation resampling of mono samples"""
+    if rate == target_rate or not samples:
+        return samples
+    count = max(1, int(len(samples) * target_rate / rate))
+    step = rate / target_rate
+    last = len(samples) - 1
+    out = array('h')
+    for i in range(count):
+        pos = i * step
+        j = min(int(pos), last)
+        frac = pos - j
+        nxt = samples[min(j + 1, last)]
+        out.append(int(samples[j] + (nxt - samples[j]) * frac))
+    return out
+
+def build_bank(root, output_file, dirs=CLIP_DIRS, sample_rate=SAMPLE_RATE):
+    """
+    Pack every clip under root into output_file as 16-bit mono PCM
+    The first file for each clip name wins, as in ClipLibrary
+    Returns (keys packed, [(path, reason) skipped])
+    """
+    keys = []
+    packed = {}
+    skipped = []
+    offsets = array('Q', [0])
+
+    with tempfile.TemporaryFile() as blob:
+        for key, path in iter_clip_files(root, dirs):
+            if not key:
+                continue
+            if key in packed:
+                skipped.append((os.path.relpath(path, root), f"duplicate of {packed[key]}"))
+                continue
+            try:
+                channels, rate, samples = read_wav(path)
+            except (OSError, ValueError, struct.error) as error:
+                skipped.append((os.path.relpath(path, root), str(error)))
+                continue
+            samples = resample(to_mono(samples, channels), rate, sample_rate)
+            if sys.byteorder == 'big':
+                samples.byteswap()
+            blob.write(samples.tobytes())
+            keys.append(key)
+            packed[key] = os.path.relpath(path, root)
+            offsets.append(offsets[-1] + len(samples))
+
+        table = json.dumps({'keys': keys, 'skipped': skipped},
+                           ensure_ascii=False).encode('utf-8')
+        table += b' ' * _pad(len(table))
+        pcm_size = offsets[-1] * 2
+
+        with open(output_file, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 1, sample_rate, len(keys), len(table), 0,
+                                pcm_size))
+            f.write(table)
+            f.write(offsets.tobytes())
+            blob.seek(0)
+            while True:
+                chunk = blob.read(1 << 20)
+                if not chunk:
+                    break
+                f.write(chunk)
+
+    return keys, skipped
+
+class AudioBank:
+    """
+    Memory-mapped reader for files written by build_bank
+    Same interface as banjara_tts.ClipLibrary: clip(key) returns a
+    zero-copy memoryview of 16-bit samples into the mapped file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, channels, rate, count, table_size, _,
+         pcm_size) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} audio bank")
+        if sys.byteorder == 'big':
+            self.close()
+            raise ValueError("Audio banks hold little-endian samples")
+        self.params = (channels, 2, rate)
+
+        pos = HEADER.size
+        table = json.loads(self._mm[pos:pos + table_size])
+        self.skipped = [tuple(item) for item in table['skipped']]
+        pos += table_size
+
+        view = memoryview(self._mm)
+        self._offsets = view[pos:pos + 8 * (count + 1)].cast('Q')
+        pos += 8 * (count + 1)
+        self._pcm = view[pos:pos + pcm_size].cast('h')
+        self._slots = {key: i for i, key in enumerate(table['keys'])}
+        self.matcher = ClipMatcher()
+        for key in table['keys']:
+            owner = self.matcher.add(key)
+            if owner is not None:
+                self.skipped.append((key, f"spelling collides with {owner}; "
+                                          f"matched by exact name only"))
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def keys(self):
+        return list(self._slots)
+
+    def clip(self, key):
+        """Samples for a clip key as a view into the mapped file"""
+        i = self._slots[key]
+        return self._pcm[self._offsets[i]:self._offsets[i + 1]]
+
+    def lookup(self, text):
+        """Return (clip keys, missing words) for banjara_english text"""
+        return match_clips(self.matcher, text)
+
+    def close(self):
+        for name in ('_offsets', '_pcm'):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack the TTS clips into one memory-mapped audio bank")
+    parser.add_argument('--clips', default='Banjara TTS', help="clip library directory")
+    parser.add_argument('-o', '--output', default='banjara_tts.bank')
+    parser.add_argument('--rate', type=int, default=SAMPLE_RATE, help="sample rate of the bank")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    keys, skipped = build_bank(args.clips, args.output, sample_rate=args.rate)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(args.output)
+    print(f"✅ Packed {len(keys)} clips into {args.output} "
+          f"({size / 1e6:.1f} MB) in {elapsed:.1f}s")
+    for path, reason in skipped:
+        print(f"⚠️ Skipped {path}: {reason}")
+
+    start = time.perf_counter()
+    with AudioBank(args.output) as bank:
+        opened = time.perf_counter() - start
+        seconds = sum(len(bank.clip(key)) for key in bank.keys()) / args.rate
+    print(f"📂 Opened in {opened * 1000:.2f} ms, {seconds:.0f}s of audio")
@@ -0,0 +1,189 @@
+"""
+Banjara Dictionary Index
+Loads dictionary_master_english.csv once into an index with O(1) headword
+lookup, a trie for prefix/autocomplete queries and a reverse index from
+banjara_english back to English. The index can be saved as a prebuilt
+file so startup skips CSV parsing and normalization.
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import pickle
+import re
+
+INDEX_VERSION = 1
+
+# Same punctuation stripping as translateWords in script.js
+_PUNCTUATION_RE = re.compile(r'[.,!?;:"\']')
+
+# Part-of-speech markers left on headwords by the scanned dictionary
+# ("accidentally ad", "always pro")
+_POS_MARKERS = ('ad', 'pro')
+
+# Trie node key marking the end of a headword
+_END = '\0'
+
+def normalize(text):
+    """Lowercase, strip punctuation and collapse whitespace"""
+    return ' '.join(_PUNCTUATION_RE.sub(' ', text.lower()).split())
+
+def headword_key(english):
+    """Normalized lookup key for a CSV headword"""
+    words = normalize(english).split()
+    if len(words) > 1 and words[-1] in _POS_MARKERS:
+        words.pop()
+    return ' '.join(words)
+
+def file_hash(path):
+    """Return the SHA-1 of a file, used as the dictionary version"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class DictionaryIndex:
+    """
+    In-memory index over dictionary entries
+    Entries are the CSV rows as dicts; lookups return them in CSV order
+    """
+
+    def __init__(self, entries, version=None):
+        self.entries = entries
+        self.version = version
+        self._headwords = {}
+        self._reverse = {}
+        self._trie = {}
+
+        for i, entry in enumerate(entries):
+            key = headword_key(entry['english'])
+            if not key:
+                continue
+            if key not in self._headwords:
+                self._insert_trie(key)
+            self._headwords.setdefault(key, []).append(i)
+            banjara = normalize(entry['banjara_english'])
+            if banjara:
+                self._reverse.setdefault(banjara, []).append(i)
+
+    @classmethod
+    def from_csv(cls, csv_file):
+        """Build the index from dictionary_master_english.csv"""
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            entries = list(csv.DictReader(f))
+        return cls(entries, version=file_hash(csv_file))
+
+    def _insert_trie(self, key):
+        node = self._trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[_END] = key
+
+    def __len__(self):
+        return len(self._headwords)
+
+    def __contains__(self, english):
+        return normalize(english) in self._headwords
+
+    def lookup(self, english):
+        """Return every entry whose headword matches english"""
+        return [self.entries[i] for i in self._headwords.get(normalize(english), ())]
+
+    def get(self, english, default=None):
+        """Return the banjara_english of the first matching entry"""
+        indexes = self._headwords.get(normalize(english))
+        return self.entries[indexes[0]]['banjara_english'] if indexes else default
+
+    def headwords(self):
+        """Return all normalized headwords"""
+        return self._headwords.keys()
+
+    def banjara_words(self):
+        """Return all normalized banjara_english forms"""
+        return self._reverse.keys()
+
+    def prefix(self, prefix, limit=10):
+        """Return up to limit headwords starting with prefix, in sorted order"""
+        node = self._trie
+        for char in normalize(prefix):
+            node = node.get(char)
+            if node is None:
+                return []
+
+        results = []
+        stack = [node]
+        while stack and len(results) < limit:
+            node = stack.pop()
+            if _END in node:
+                results.append(node[_END])
+            stack.extend(node[char] for char in sorted(node, reverse=True) if char != _END)
+        return results
+
+    def reverse_lookup(self, banjara):
+        """Return every entry whose banjara_english matches banjara"""
+        return [self.entries[i] for i in self._reverse.get(normalize(banjara), ())]
+
+    def save(self, path):
+        """Write the prebuilt index file"""
+        state = (INDEX_VERSION, self.entries, self.version,
+                 self._headwords, self._reverse, self._trie)
+        with open(path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save() without re-normalizing anything"""
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        if state[0] != INDEX_VERSION:
+            raise ValueError(f"{path} was built by an incompatible index version")
+        index = cls.__new__(cls)
+        (_, index.entries, index.version,
+         index._headwords, index._reverse, index._trie) = state
+        return index
+
+def load_index(csv_file='dictionary_master_english.csv', index_file=None):
+    """
+    Load the prebuilt index, rebuilding it if the CSV is newer or the
+    file is missing or from an older version
+    """
+    index_file = index_file or os.path.splitext(csv_file)[0] + '.index'
+    if (os.path.exists(index_file)
+            and os.path.getmtime(index_file) >= os.path.getmtime(csv_file)):
+        try:
+            return DictionaryIndex.load(index_file)
+        except (ValueError, pickle.UnpicklingError, EOFError):
+            pass
+    index = DictionaryIndex.from_csv(csv_file)
+    index.save(index_file)
+    return index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the Banjara dictionary index")
+    parser.add_argument('query', nargs='?', help="English headword to look up")
+    parser.add_argument('--csv', default='dictionary_master_english.csv')
+    parser.add_argument('--index', help="prebuilt index file (default: CSV name with .index)")
+    parser.add_argument('--build', action='store_true', help="rebuild the index file")
+    parser.add_argument('--prefix', help="list headwords starting with this prefix")
+    parser.add_argument('--reverse', help="look up a banjara_english word")
+    args = parser.parse_args()
+
+    if args.build:
+        index = DictionaryIndex.from_csv(args.csv)
+        index_file = args.index or os.path.splitext(args.csv)[0] + '.index'
+        index.save(index_file)
+        print(f"✅ Indexed {len(index)} headwords into {index_file}")
+    else:
+        index = load_index(args.csv, args.index)
+
+    if args.query:
+        for entry in index.lookup(args.query):
+            print(f"  {entry['english']} ({entry['part_of_speech']}): {entry['banjara_english']}")
+    if args.prefix:
+        for headword in index.prefix(args.prefix):
+            print(f"  {headword}")
+    if args.reverse:
+        for entry in index.reverse_lookup(args.reverse):
+            print(f"  {entry['banjara_english']}: {entry['english']}")
@@ -0,0 +1,379 @@
+"""
+Banjara Text-to-Speech
+Concatenative synthesis over the recorded clips in "Banjara TTS".
+Each banjara_english word or phrase is mapped to its clip through a
+normalized filename index, and the clips are joined with a crossfade or
+a silence gap into a single WAV, or streamed chunk by chunk as each
+clip is joined. Clips are decoded once and shared by every utterance
+synthesized from the same library.
+"""
+
+import argparse
+import itertools
+import os
+import re
+import struct
+import sys
+import threading
+import wave
+from array import array
+from collections import namedtuple
+
+import instrumentation
+from banjara_dictionary import normalize
+from translator import PhraseMatcher
+
+CLIP_DIRS = ('dictionary', 'pages', 'numbers')
+
+# array typecodes for supported PCM sample widths
+_TYPECODES = {2: 'h', 4: 'i'}
+
+_ASPIRATED_RE = re.compile(r'([bcdgjkpt])h')
+_REPEATED_RE = re.compile(r'(.)\1+')
+
+def clip_key(name):
+    """
+    Spelling-insensitive key for a romanized Banjara word or clip name
+    The recordings and the dictionary spell the same word differently
+    ("aasmaan" / "asmaan", "abbhyal" / "abbyal", "thees" / "tees"), so
+    aspiration, long vowels and doubled letters are folded away. Distinct
+    words can fold together ("saat" / "saath"), so this is only the
+    fallback after the exact name
+    """
+    key = _ASPIRATED_RE.sub(r'\1', normalize(name))
+    key = key.replace('ee', 'i').replace('oo', 'u')
+    return _REPEATED_RE.sub(r'\1', key)
+
+def iter_clip_files(root, dirs=CLIP_DIRS):
+    """Yield (normalized clip name, path) for every WAV file under root's clip directories"""
+    for name in dirs:
+        folder = os.path.join(root, name)
+        if not os.path.isdir(folder):
+            continue
+        for filename in sorted(os.listdir(folder)):
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() == '.wav':
+                yield normalize(stem), os.path.join(folder, filename)
+
+class ClipMatcher:
+    """
+    Phrase matchers over clip names: one on the exact normalized names and
+    one on their clip_key spellings, each pointing at the clip name
+    """
+
+    def __init__(self):
+        self.exact = PhraseMatcher()
+        self.folded = PhraseMatcher()
+        self._folded = {}
+
+    def add(self, key):
+        """
+        Add a clip name; returns the earlier clip name that already owns
+        its folded spelling, or None
+        """
+        self.exact.add(key, key)
+        folded = clip_key(key)
+        owner = self._folded.setdefault(folded, key)
+        if owner != key:
+            return owner
+        self.folded.add(folded, key)
+        return None
+
+def match_clips(matcher, text):
+    """
+    Split banjara_english text into clip names, longest clip first
+    An exact name match wins over a spelling match of the same length
+    Returns (keys, missing words); bracketed words left untranslated
+    by the translator are reported as missing
+    """
+    tokens = []
+    missing = []
+    for token in normalize(text).split():
+        if token.startswith('[') or token.endswith(']'):
+            missing.append(token.strip('[]'))
+        else:
+            tokens.append(token)
+    folded = [clip_key(token) for token in tokens]
+
+    keys = []
+    pos = 0
+    while pos < len(tokens):
+        match = matcher.exact.match(tokens, pos)
+        fallback = matcher.folded.match(folded, pos)
+        if fallback and (not match or fallback[0] > match[0]):
+            match = fallback
+        if match:
+            length, key = match
+            keys.append(key)
+            pos += length
+        else:
+            missing.append(tokens[pos])
+            pos += 1
+    return keys, missing
+
+Speech = namedtuple('Speech', 'wav words missing')
+
+# Streaming counterpart of Speech: chunks is an iterator of bytes
+SpeechStream = namedtuple('SpeechStream', 'chunks words missing')
+
+class ClipLibrary:
+    """
+    Filename index and shared decoded-clip cache over a clip directory
+    All clips must share the first clip's channels, sample width and rate;
+    clips that differ or cannot be read, later files with an already-used
+    name and clips only reachable by exact name because their folded
+    spelling is taken are listed in skipped
+    """
+
+    def __init__(self, root='Banjara TTS', dirs=CLIP_DIRS):
+        self.root = root
+        self.params = None
+        self.paths = {}
+        self.skipped = []
+        self.matcher = ClipMatcher()
+        self._clips = {}
+        self._lock = threading.Lock()
+
+        for key, path in iter_clip_files(root, dirs):
+            self._add(key, path)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def keys(self):
+        return list(self.paths)
+
+    def _add(self, key, path):
+        if not key:
+            return
+        if key in self.paths:
+            self.skipped.append((path, f"duplicate of {self.paths[key]}"))
+            return
+        try:
+            with wave.open(path, 'rb') as f:
+                params = (f.getnchannels(), f.getsampwidth(), f.getframerate())
+        except (wave.Error, EOFError) as error:
+            self.skipped.append((path, str(error)))
+            return
+        if params[1] not in _TYPECODES:
+            self.skipped.append((path, f"unsupported sample width {params[1]}"))
+            return
+        if self.params is None:
+            self.params = params
+        elif params != self.params:
+            self.skipped.append((path, f"format {params} differs from {self.params}"))
+            return
+        self.paths[key] = path
+        owner = self.matcher.add(key)
+        if owner is not None:
+            self.skipped.append((path, f"spelling collides with {self.paths[owner]}; "
+                                       f"matched by exact name only"))
+
+    def clip(self, key):
+        """Decoded samples for a clip key, read from disk only the first time"""
+        samples = self._clips.get(key)
+        if samples is None:
+            with self._lock:
+                samples = self._clips.get(key)
+                if samples is None:
+                    with instrumentation.stage('clip_read'):
+                        samples = self._read(self.paths[key])
+                    instrumentation.count('clips_read')
+                    self._clips[key] = samples
+        return samples
+
+    def _read(self, path):
+        with wave.open(path, 'rb') as f:
+            samples = array(_TYPECODES[f.getsampwidth()], f.readframes(f.getnframes()))
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        return samples
+
+    def preload(self):
+        """Decode every clip now instead of on first use"""
+        for key in self.paths:
+            self.clip(key)
+
+    def lookup(self, text):
+        """Return (clip keys, missing words) for banjara_english text"""
+        return match_clips(self.matcher, text)
+
+class Synthesizer:
+    """
+    Joins library clips into one utterance
+    The library is a ClipLibrary or an audio_bank.AudioBank
+    """
+
+    def __init__(self, library, crossfade_ms=15.0, gap_ms=60.0):
+        self.library = library
+        self.crossfade_ms = crossfade_ms
+        self.gap_ms = gap_ms
+
+    def _frames(self, ms):
+        return int(self.library.params[2] * ms / 1000)
+
+    def _iter_pieces(self, keys):
+        """
+        Yield sample buffers for the joined clips, and None after each clip
+        The last crossfade_ms of every clip is held back until the next
+        clip is known, so nothing already yielded has to change
+        """
+        channels, width, _ = self.library.params
+        fade = self._frames(self.crossfade_ms)
+        gap = self._frames(self.gap_ms) * channels
+        tail = array(_TYPECODES[width])
+        for i, key in enumerate(keys):
+            clip = memoryview(self.library.clip(key))
+            if i and gap:
+                _fade_out(tail, fade, channels)
+                yield tail
+                yield array(tail.typecode, bytes(gap * width))
+                head = _faded_in(clip, fade, channels)
+                yield head
+                clip = clip[len(head):]
+            elif i:
+                clip = clip[_crossfade(tail, clip, fade, channels):]
+                yield tail
+            hold = min(fade, len(clip) // channels) * channels
+            yield clip[:len(clip) - hold]
+            tail = array(tail.typecode)
+            tail.frombytes(clip[len(clip) - hold:].cast('B'))
+            yield None
+        yield tail
+
+    def _iter_chunks(self, keys, chunk_bytes):
+        """PCM bytes in chunks of at most chunk_bytes, flushed after every clip"""
+        instrumentation.count('clips_spoken', len(keys))
+        buffer = bytearray()
+        total = 0
+        for piece in self._iter_pieces(keys):
+            if piece is not None:
+                if sys.byteorder == 'big':
+                    piece = array(piece.typecode if isinstance(piece, array) else piece.format,
+                                  piece)
+                    piece.byteswap()
+                buffer += memoryview(piece).cast('B')
+            while len(buffer) >= chunk_bytes or (piece is None and buffer):
+                total += min(len(buffer), chunk_bytes)
+                yield bytes(buffer[:chunk_bytes])
+                del buffer[:chunk_bytes]
+        if buffer:
+            total += len(buffer)
+            yield bytes(buffer)
+        instrumentation.count('pcm_bytes_out', total)
+
+    def stream(self, text, chunk_bytes=32768, header=True):
+        """
+        Return a SpeechStream whose chunks yield audio as each clip is joined
+        With header=True the first chunk is a WAV header with open-ended
+        sizes; otherwise chunks are raw little-endian PCM in library.params
+        """
+        keys, missing = self.library.lookup(text)
+        instrumentation.count('missing_words', len(missing))
+        chunks = self._iter_chunks(keys, chunk_bytes)
+        if header:
+            chunks = itertools.chain([wav_header(*self.library.params)], chunks)
+        return SpeechStream(chunks, keys, missing)
+
+    def synthesize(self, text):
+        """Return a Speech with the WAV bytes for banjara_english text"""
+        with instrumentation.stage('synthesize'):
+            keys, missing = self.library.lookup(text)
+            pcm = b''.join(self._iter_chunks(keys, 1 << 20))
+        instrumentation.count('missing_words', len(missing))
+        return Speech(wav_header(*self.library.params, len(pcm)) + pcm, keys, missing)
+
+def _fade_out(samples, frames, channels):
+    frames = min(frames, len(samples) // channels)
+    start = len(samples) - frames * channels
+    for i in range(frames * channels):
+        weight = 1 - (i // channels + 1) / (frames + 1)
+        samples[start + i] = int(samples[start + i] * weight)
+
+def _faded_in(clip, frames, channels):
+    """The first frames of clip with a linear fade-in"""
+    frames = min(frames, len(clip) // channels)
+    return array(_TYPECODES[clip.itemsize],
+                 (int(clip[i] * ((i // channels + 1) / (frames + 1)))
+                  for i in range(frames * channels)))
+
+def _crossfade(samples, clip, frames, channels):
+    """
+    Mix the start of clip into the end of samples with a linear crossfade
+    Returns the number of clip samples used
+    """
+    frames = min(frames, len(samples) // channels, len(clip) // channels)
+    start = len(samples) - frames * channels
+    for i in range(frames * channels):
+        weight = (i // channels + 1) / (frames + 1)
+        samples[start + i] = int(samples[start + i] * (1 - weight) + clip[i] * weight)
+    return frames * channels
+
+def wav_header(channels, width, rate, data_size=None):
+    """
+    44-byte PCM WAV header
+    Without data_size the RIFF and data sizes are set to 0xFFFFFFFF, the
+    usual marker for a stream of unknown length
+    """
+    riff_size = 0xFFFFFFFF if data_size is None else 36 + data_size
+    data_size = 0xFFFFFFFF if data_size is None else data_size
+    return struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', riff_size, b'WAVE', b'fmt ', 16, 1,
+                       channels, rate, rate * channels * width, channels * width, width * 8,
+                       b'data', data_size)
+
+_LIBRARIES = {}
+_LIBRARIES_LOCK = threading.Lock()
+
+def get_library(root='Banjara TTS'):
+    """
+    Shared clip source for root, opened on first use
+    root is a clip directory or an audio bank built by audio_bank.py
+    """
+    root = os.path.abspath(root)
+    with _LIBRARIES_LOCK:
+        if root not in _LIBRARIES:
+            if os.path.isfile(root):
+                from audio_bank import AudioBank
+                _LIBRARIES[root] = AudioBank(root)
+            else:
+                _LIBRARIES[root] = ClipLibrary(root)
+        return _LIBRARIES[root]
+
+def synthesize(text, root='Banjara TTS', crossfade_ms=15.0, gap_ms=60.0):
+    """Synthesize banjara_english text with the shared library for root"""
+    return Synthesizer(get_library(root), crossfade_ms, gap_ms).synthesize(text)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Speak Banjara text from recorded clips")
+    parser.add_argument('text', nargs='+', help="banjara_english text (English with --english)")
+    parser.add_argument('-o', '--output', default='speech.wav')
+    parser.add_argument('--clips', default='Banjara TTS',
+                        help="library root (holding dictionary/, pages/ and numbers/) or audio bank")
+    parser.add_argument('--english', action='store_true', help="translate English text first")
+    parser.add_argument('--csv', default='dictionary_master_english.csv')
+    parser.add_argument('--crossfade', type=float, default=15.0, help="crossfade in ms")
+    parser.add_argument('--gap', type=float, default=60.0,
+                        help="silence between words in ms (0 crossfades instead)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    with instrumentation.run('banjara_tts', args.metrics, args.profile):
+        text = ' '.join(args.text)
+        if args.english:
+            from translator import Translator
+            with instrumentation.stage('translate'):
+                text = Translator.from_csv(args.csv).translate(text).text
+            print(f"💬 {text}")
+
+        with instrumentation.stage('index'):
+            library = get_library(args.clips)
+        print(f"🔊 Indexed {len(library)} clips ({len(library.skipped)} skipped)")
+        if not len(library):
+            parser.error(f"no clips found in {args.clips}; --clips takes the library root "
+                         f"holding {', '.join(CLIP_DIRS)}")
+        speech = Synthesizer(library, args.crossfade, args.gap).synthesize(text)
+        with open(args.output, 'wb') as f:
+            f.write(speech.wav)
+    print(f"✅ Spoke {len(speech.words)} clips to {args.output}")
+    if speech.missing:
+        print(f"⚠️ No recording for: {', '.join(speech.missing)}")
@@ -0,0 +1,257 @@
+"""
+Pipeline Benchmarks
+Times the hot paths of the data and translation pipeline on reproducible
+fixtures built from dictionary_master_english.csv and sentences_10k.json,
+optionally scaled up synthetically. Results are written to JSON, and
+--compare flags regressions against a saved baseline.
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from banjara_dictionary import load_index
+from generate_sentences import generate_sentences
+from simplify_phonetics import simplify_dictionary, simplify_phonetic
+from translator import Translator, tokenize
+
+RESULTS_VERSION = 1
+
+class Fixtures:
+    """
+    Benchmark inputs, scale times the size of the source data
+    Extra items are made by pairing random source items with a seeded
+    RNG, so every run at the same scale and seed sees the same data
+    """
+
+    def __init__(self, scale=1, seed=0, csv_file='dictionary_master_english.csv',
+                 corpus='sentences_10k.json', clips='Banjara TTS', workdir=None):
+        self.scale = scale
+        self.seed = seed
+        self.clips = clips
+        self.workdir = workdir or tempfile.mkdtemp(prefix='banjara_bench_')
+        rng = random.Random(seed)
+
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            rows = [row for row in csv.DictReader(f) if row['phonetics'].strip()]
+        phonetics = [row['phonetics'] for row in rows]
+        self.phonetics = _scaled(phonetics, scale, rng)
+
+        dictionary = {}
+        for i, phonetic in enumerate(self.phonetics):
+            dictionary[f"{rows[i % len(rows)]['english']} {i}"] = phonetic
+        self.dictionary_file = os.path.join(self.workdir, 'dictionary.json')
+        with open(self.dictionary_file, 'w', encoding='utf-8') as f:
+            json.dump(dictionary, f, ensure_ascii=False)
+
+        with open(corpus, 'r', encoding='utf-8') as f:
+            sentences = [record['text'] for record in json.load(f)]
+        self.sentences = _scaled(sentences, scale, rng)
+        self.token_lists = [tokenize(sentence) for sentence in self.sentences]
+        self.tokens = [token for tokens in self.token_lists for token in tokens]
+
+        self.index = load_index(csv_file)
+        self.translator = Translator.from_csv(csv_file)
+
+def _scaled(items, scale, rng):
+    """items, followed by (scale - 1) * len(items) pairs of random items"""
+    extra = int(len(items) * (scale - 1))
+    return items + [f"{rng.choice(items)} {rng.choice(items)}" for _ in range(extra)]
+
+def _best_time(fn, repeat):
+    """Fastest of repeat runs, the least noisy estimate on a shared machine"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def _result(value, unit, better='lower', **extra):
+    return dict(value=value, unit=unit, better=better, **extra)
+
+def bench_simplify_phonetic(fixtures, repeat):
+    """Per-string cost of simplify_phonetic"""
+    texts = fixtures.phonetics
+    seconds = _best_time(lambda: [simplify_phonetic(text) for text in texts], repeat)
+    return _result(seconds / len(texts) * 1e6, 'us/string', strings=len(texts))
+
+def bench_simplify_dictionary(fixtures, repeat):
+    """End-to-end simplify_dictionary throughput, JSON file in and out"""
+    output = os.path.join(fixtures.workdir, 'dictionary_simplified.json')
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            simplify_dictionary(fixtures.dictionary_file, output)
+
+    seconds = _best_time(run, repeat)
+    entries = len(fixtures.phonetics)
+    return _result(entries / seconds, 'entries/s', 'higher', entries=entries, seconds=seconds)
+
+def bench_generate_sentences(fixtures, repeat):
+    """
+    Wall time and peak traced memory of generate_sentences for
+    10,000 * scale sentences; past the 10,359 TEMPLATES sentences the
+    rest come from EXTENDED_TEMPLATES
+    """
+    count = int(10000 * fixtures.scale)
+    seconds = _best_time(lambda: generate_sentences(count, fixtures.seed), repeat)
+    tracemalloc.start()
+    generate_sentences(count, fixtures.seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _result(seconds * 1000, 'ms', sentences=count, peak_mb=peak / 1e6)
+
+def bench_dictionary_lookup(fixtures, repeat):
+    """DictionaryIndex.lookup latency per corpus token"""
+    lookup = fixtures.index.lookup
+    tokens = fixtures.tokens
+    seconds = _best_time(lambda: [lookup(token) for token in tokens], repeat)
+    return _result(seconds / len(tokens) * 1e9, 'ns/lookup', lookups=len(tokens))
+
+def bench_phrase_matching(fixtures, repeat):
+    """PhraseMatcher.match latency per token position"""
+    match = fixtures.translator.matcher.match
+
+    def run():
+        for tokens in fixtures.token_lists:
+            for pos in range(len(tokens)):
+                match(tokens, pos)
+
+    seconds = _best_time(run, repeat)
+    return _result(seconds / len(fixtures.tokens) * 1e9, 'ns/position',
+                   positions=len(fixtures.tokens))
+
+def bench_translate(fixtures, repeat):
+    """Full sentence translation latency"""
+    translate = fixtures.translator.translate
+    sentences = fixtures.sentences
+    seconds = _best_time(lambda: [translate(sentence) for sentence in sentences], repeat)
+    return _result(seconds / len(sentences) * 1e6, 'us/sentence', sentences=len(sentences))
+
+def bench_tts_concatenation(fixtures, repeat):
+    """Synthesizer.synthesize time for 8-clip utterances, clips already cached"""
+    from banjara_tts import Synthesizer, get_library
+    library = get_library(fixtures.clips)
+    keys = sorted(library.keys())
+    rng = random.Random(fixtures.seed)
+    utterances = [' '.join(rng.choice(keys) for _ in range(8))
+                  for _ in range(max(1, int(20 * fixtures.scale)))]
+    synthesizer = Synthesizer(library)
+    for text in utterances:
+        synthesizer.synthesize(text)
+    seconds = _best_time(lambda: [synthesizer.synthesize(text) for text in utterances],
+                           repeat)
+    return _result(seconds / len(utterances) * 1000, 'ms/utterance',
+                   utterances=len(utterances))
+
+BENCHMARKS = {
+    'simplify_phonetic': bench_simplify_phonetic,
+    'simplify_dictionary': bench_simplify_dictionary,
+    'generate_sentences': bench_generate_sentences,
+    'dictionary_lookup': bench_dictionary_lookup,
+    'phrase_matching': bench_phrase_matching,
+    'translate': bench_translate,
+    'tts_concatenation': bench_tts_concatenation,
+}
+
+def run_benchmarks(fixtures, names=None, repeat=5):
+    """Run the named benchmarks (default all) and return the results document"""
+    results = {}
+    for name in names or BENCHMARKS:
+        results[name] = result = BENCHMARKS[name](fixtures, repeat)
+        print(f"  {name:<20} {result['value']:>12,.3f} {result['unit']}")
+    return {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'scale': fixtures.scale,
+            'seed': fixtures.seed,
+            'repeat': repeat,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+# Settings that change what is measured; results are only comparable
+# when these match
+COMPARABLE_META = ('scale', 'seed', 'repeat')
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Compare two results documents benchmark by benchmark
+    Returns [(name, baseline value, current value, relative change, regressed)]
+    where regressed means worse than the baseline by more than threshold.
+    Raises ValueError when the runs used a different scale, seed or repeat
+    """
+    mismatched = [f"{key} {baseline['meta'].get(key)} vs {current['meta'].get(key)}"
+                  for key in COMPARABLE_META
+                  if baseline['meta'].get(key) != current['meta'].get(key)]
+    if mismatched:
+        raise ValueError(f"baseline is not comparable: {', '.join(mismatched)}")
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None or not base['value']:
+            continue
+        change = (result['value'] - base['value']) / base['value']
+        worse = change if result['better'] == 'lower' else -change
+        rows.append((name, base['value'], result['value'], change, worse > threshold))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Banjara data and translation pipeline")
+    parser.add_argument('-o', '--output', default='benchmark_results.json')
+    parser.add_argument('--scale', type=float, default=1,
+                        help="fixture size as a multiple of the source data (up to 100)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="runs per benchmark (the fastest is kept)")
+    parser.add_argument('--only', help="comma-separated benchmarks to run: " + ', '.join(BENCHMARKS))
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="flag regressions against a saved results file")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="relative slowdown that counts as a regression")
+    parser.add_argument('--clips', default='Banjara TTS', help="TTS clip directory or audio bank")
+    args = parser.parse_args()
+
+    names = args.only.split(',') if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    if not 0 < args.scale <= 100:
+        parser.error("--scale must be between 0 and 100")
+
+    print(f"🧪 Building fixtures at {args.scale}x...")
+    with tempfile.TemporaryDirectory(prefix='banjara_bench_') as workdir:
+        fixtures = Fixtures(args.scale, args.seed, clips=args.clips, workdir=workdir)
+        document = run_benchmarks(fixtures, names, args.repeat)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+    print(f"✅ Saved results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        try:
+            rows = compare(document, baseline, args.threshold)
+        except ValueError as error:
+            print(f"❌ {args.compare}: {error}")
+            sys.exit(2)
+        print(f"\n📊 Against {args.compare} (threshold {args.threshold:.0%}):")
+        for name, base, value, change, regressed in rows:
+            flag = '❌ regression' if regressed else '✅'
+            print(f"  {name:<20} {base:>12,.3f} -> {value:>12,.3f} ({change:+.1%}) {flag}")
+        if any(row[4] for row in rows):
+            sys.exit(1)
@@ -0,0 +1,354 @@
+"""
+Bulk Sentence Uploader
+Python replacement for upload_sentences.js. Streams records from a
+generate_sentences.py corpus (.json, .jsonl or .bin), keeps several batch
+commits in flight with retries and exponential backoff, and checkpoints
+the last contiguously committed record so an interrupted run resumes
+where it stopped. Commits are upserts keyed by sentence id that only
+write the corpus fields of documents that already exist, so batches
+re-sent after a crash neither duplicate sentences nor reset volunteer
+assignments and completion counts.
+
+Backends:
+  sqlite:PATH      local SQLite stand-in for testing
+  firestore        Cloud Firestore (needs google-cloud-firestore)
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+import instrumentation
+from sentence_corpus import SentenceCorpus
+from simplify_phonetics import iter_json_array
+
+CHECKPOINT_VERSION = 1
+
+# Firestore allows at most 500 writes per batch
+BATCH_SIZE = 500
+
+def iter_sentence_records(path):
+    """Yield sentence records from a .json array, .jsonl or .bin corpus without loading it"""
+    if path.lower().endswith('.bin'):
+        with SentenceCorpus(path) as corpus:
+            yield from corpus
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(f)
+
+def to_document(record):
+    """
+    Sentence fields taken from the corpus, same as upload_sentences.js
+    These are the only fields written to a document that already exists
+    """
+    return {
+        'id': record['id'],
+        'english': record['text'],
+        'category': record['category'],
+        'difficulty': record.get('difficulty', ''),
+    }
+
+def new_document_fields():
+    """Volunteer fields set only when a sentence document is created"""
+    return {'assignedTo': [], 'completedBy': 0}
+
+class SQLiteBackend:
+    """
+    Local stand-in for Firestore: one row per sentence, upserted by id
+    Re-sent rows only update the corpus fields, like FirestoreBackend.
+    Each worker thread gets its own connection
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        with sqlite3.connect(path) as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS sentences ("
+                       "id INTEGER PRIMARY KEY, english TEXT, category TEXT, difficulty TEXT, "
+                       "assigned_to TEXT, completed_by INTEGER, created_at REAL)")
+            db.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value TEXT)")
+
+    def __str__(self):
+        return f"sqlite:{self.path}"
+
+    def _connection(self):
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path, timeout=60)
+        return db
+
+    def commit(self, records):
+        now = time.time()
+        fresh = new_document_fields()
+        rows = [(doc['id'], doc['english'], doc['category'], doc['difficulty'],
+                 json.dumps(fresh['assignedTo']), fresh['completedBy'], now)
+                for doc in map(to_document, records)]
+        db = self._connection()
+        with db:
+            db.executemany("INSERT INTO sentences VALUES (?, ?, ?, ?, ?, ?, ?) "
+                           "ON CONFLICT(id) DO UPDATE SET english = excluded.english, "
+                           "category = excluded.category, difficulty = excluded.difficulty",
+                           rows)
+
+    def finish(self, total):
+        """Update totalSentences in the global stats row, like the stats/global document"""
+        db = self._connection()
+        with db:
+            row = db.execute("SELECT value FROM stats WHERE name = 'global'").fetchone()
+            stats = json.loads(row[0]) if row else {'totalTranslations': 0, 'totalUsers': 0}
+            stats.update(totalSentences=total, lastUpdated=time.time())
+            db.execute("INSERT OR REPLACE INTO stats VALUES ('global', ?)", (json.dumps(stats),))
+
+    def count(self):
+        return self._connection().execute("SELECT COUNT(*) FROM sentences").fetchone()[0]
+
+class FirestoreBackend:
+    """
+    Cloud Firestore sentences collection, written with batched set() calls
+    Each batch first reads which documents exist: new ones get the
+    volunteer fields and createdAt, existing ones only have their corpus
+    fields merged, so re-sent batches keep assignments and completions
+    """
+
+    def __init__(self, collection='sentences', project=None):
+        try:
+            from google.cloud import firestore
+        except ImportError:
+            raise RuntimeError("The firestore backend needs google-cloud-firestore "
+                               "(pip install google-cloud-firestore)") from None
+        self._firestore = firestore
+        self._client = firestore.Client(project=project)
+        self.collection = collection
+
+    def __str__(self):
+        return f"firestore:{self.collection}"
+
+    def commit(self, records):
+        collection = self._client.collection(self.collection)
+        refs = [collection.document(str(record['id'])) for record in records]
+        existing = {snapshot.id for snapshot in self._client.get_all(refs, field_paths=['id'])
+                    if snapshot.exists}
+        batch = self._client.batch()
+        for ref, record in zip(refs, records):
+            doc = to_document(record)
+            if ref.id in existing:
+                batch.set(ref, doc, merge=True)
+            else:
+                doc.update(new_document_fields(), createdAt=self._firestore.SERVER_TIMESTAMP)
+                batch.set(ref, doc)
+        batch.commit()
+
+    def finish(self, total):
+        """Update totalSentences on stats/global, leaving the volunteer counters alone"""
+        self._client.collection('stats').document('global').set({
+            'totalSentences': total,
+            'lastUpdated': self._firestore.SERVER_TIMESTAMP,
+        }, merge=True)
+
+class FlakyBackend:
+    """Wraps a backend and fails a fraction of commits, to exercise retries"""
+
+    def __init__(self, backend, failure_rate, seed=0):
+        self.backend = backend
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return str(self.backend)
+
+    def commit(self, records):
+        with self._lock:
+            fail = self._rng.random() < self.failure_rate
+        if fail:
+            raise ConnectionError("injected commit failure")
+        self.backend.commit(records)
+
+    def finish(self, total):
+        self.backend.finish(total)
+
+def open_backend(spec):
+    """Backend from a spec such as 'sqlite:sentences.db' or 'firestore'"""
+    kind, _, arg = spec.partition(':')
+    if kind == 'sqlite':
+        return SQLiteBackend(arg or 'sentences.db')
+    if kind == 'firestore':
+        return FirestoreBackend(arg or 'sentences')
+    raise ValueError(f"Unknown backend {spec!r}")
+
+def load_checkpoint(path, source, backend):
+    """(records already committed, id of the last one) for this source and backend, or (0, None)"""
+    if not path or not os.path.exists(path):
+        return 0, None
+    with open(path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+    if (checkpoint.get('version') != CHECKPOINT_VERSION or checkpoint.get('source') != source
+            or checkpoint.get('backend') != str(backend)):
+        return 0, None
+    return checkpoint['position'], checkpoint.get('last_id')
+
+def save_checkpoint(path, source, backend, position, last_id):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'version': CHECKPOINT_VERSION, 'source': source, 'backend': str(backend),
+                   'position': position, 'last_id': last_id}, f)
+    os.replace(tmp, path)
+
+def _commit_with_retry(backend, batch, retries, backoff):
+    """Commit one batch, retrying with exponential backoff and jitter; returns retries used"""
+    for attempt in range(retries + 1):
+        try:
+            backend.commit(batch)
+            return attempt
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+def upload(source, backend, checkpoint_file=None, batch_size=BATCH_SIZE, concurrency=4,
+           retries=5, backoff=0.5, restart=False, progress_every=20):
+    """
+    Upload every record of source to backend
+    Up to concurrency batches are in flight at once. The checkpoint
+    records how many leading records are committed (and the last of
+    their ids); it only advances past a batch once every earlier batch
+    has committed too, so resuming never skips a record. If the record
+    at the checkpoint no longer has the saved id (the corpus was
+    regenerated in place), the upload starts over from the first record.
+    Returns a stats dict
+    """
+    source_key = os.path.abspath(source)
+    skip, last_id = 0, None
+    if not restart:
+        skip, last_id = load_checkpoint(checkpoint_file, source_key, backend)
+    records = iter_sentence_records(source)
+    if skip:
+        previous = next(islice(records, skip - 1, None), None)
+        if previous is None or previous['id'] != last_id:
+            print(f"⚠️ {source} changed since the checkpoint (record {skip:,} is not id "
+                  f"{last_id}); starting over")
+            skip = 0
+            records.close()
+            records = iter_sentence_records(source)
+
+    done = {}          # batch number -> (records, last id) for batches not yet in the prefix
+    next_batch = 0     # next batch number to submit
+    committed = 0      # next batch number the checkpoint is waiting for
+    position = skip
+    uploaded = retried = 0
+    in_flight = {}
+    reported = 0
+    start = time.perf_counter()
+
+    def advance():
+        nonlocal committed, position, last_id
+        moved = False
+        while committed in done:
+            count, batch_last_id = done.pop(committed)
+            position += count
+            last_id = batch_last_id
+            committed += 1
+            moved = True
+        if moved and checkpoint_file:
+            save_checkpoint(checkpoint_file, source_key, backend, position, last_id)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool, instrumentation.stage('upload'):
+        try:
+            while True:
+                while len(in_flight) < concurrency:
+                    batch = list(islice(records, batch_size))
+                    if not batch:
+                        break
+                    future = pool.submit(_commit_with_retry, backend, batch, retries, backoff)
+                    in_flight[future] = (next_batch, len(batch), batch[-1]['id'])
+                    next_batch += 1
+                if not in_flight:
+                    break
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    number, count, batch_last_id = in_flight.pop(future)
+                    retried += future.result()
+                    uploaded += count
+                    done[number] = (count, batch_last_id)
+                advance()
+                if progress_every and committed >= reported + progress_every:
+                    reported = committed
+                    elapsed = time.perf_counter() - start
+                    print(f"  {position:,} committed ({uploaded / elapsed:,.0f} records/s)")
+        finally:
+            # On failure, let the other in-flight batches finish so the
+            # checkpoint covers as much as possible
+            for future in list(in_flight):
+                number, count, batch_last_id = in_flight.pop(future)
+                if future.exception() is None:
+                    done[number] = (count, batch_last_id)
+                    uploaded += count
+            advance()
+
+    elapsed = time.perf_counter() - start
+    instrumentation.count('records_uploaded', uploaded)
+    instrumentation.count('batches', next_batch)
+    instrumentation.count('retries', retried)
+    return {
+        'skipped': skip,
+        'uploaded': uploaded,
+        'total': position,
+        'batches': next_batch,
+        'retries': retried,
+        'seconds': elapsed,
+        'records_per_second': uploaded / elapsed if elapsed else 0.0,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upload a sentence corpus in concurrent, resumable batches")
+    parser.add_argument('source', nargs='?', default='sentences_10k.json',
+                        help="corpus from generate_sentences.py (.json, .jsonl or .bin)")
+    parser.add_argument('--backend', default='sqlite:sentences.db',
+                        help="sqlite:PATH or firestore[:COLLECTION]")
+    parser.add_argument('--checkpoint', help="checkpoint file (default: SOURCE.upload.json)")
+    parser.add_argument('--restart', action='store_true', help="ignore the checkpoint")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--concurrency', type=int, default=4, help="batches in flight at once")
+    parser.add_argument('--retries', type=int, default=5, help="retries per batch")
+    parser.add_argument('--backoff', type=float, default=0.5,
+                        help="first retry delay in seconds, doubled on every retry")
+    parser.add_argument('--fail-rate', type=float, default=0.0,
+                        help="fail this fraction of commits on purpose (testing)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    with instrumentation.run('bulk_upload', args.metrics, args.profile):
+        backend = open_backend(args.backend)
+        if args.fail_rate:
+            backend = FlakyBackend(backend, args.fail_rate)
+        checkpoint = args.checkpoint or args.source + '.upload.json'
+
+        print(f"📤 Uploading {args.source} to {backend} "
+              f"({args.batch_size} per batch, {args.concurrency} in flight)...")
+        try:
+            stats = upload(args.source, backend, checkpoint, args.batch_size, args.concurrency,
+                           args.retries, args.backoff, args.restart)
+        except Exception as error:
+            print(f"❌ Upload stopped: {error}")
+            print(f"   Progress is saved in {checkpoint}; run again to resume")
+            sys.exit(1)
+        backend.finish(stats['total'])
+
+    if stats['skipped']:
+        print(f"⏩ Resumed after {stats['skipped']:,} records already committed")
+    print(f"✅ Uploaded {stats['uploaded']:,} records in {stats['batches']} batches "
+          f"({stats['retries']} retries) in {stats['seconds']:.1f}s "
+          f"- {stats['records_per_second']:,.0f} records/s")
@@ -0,0 +1,333 @@
+"""
+Sentence Corpus Index
+Tokenizes the sentence corpus once into an inverted index: every token
+maps to the sorted IDs of the sentences containing it, stored as compact
+unsigned int arrays. Answers which sentences contain a word, which
+dictionary headwords no sentence covers yet, and which N sentences to
+translate next to cover the most new headwords. The saved index is
+updated in place as sentences are added to the corpus.
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import os
+import pickle
+from array import array
+from bisect import bisect_left, insort
+
+import instrumentation
+from banjara_dictionary import headword_key, load_index
+from bulk_upload import iter_sentence_records
+from inflections import inflect
+from translator import tokenize
+
+INDEX_VERSION = 1
+
+_EMPTY = array('I')
+
+def _intersect(a, b):
+    """Sorted intersection of two sorted ID arrays"""
+    if len(a) > len(b):
+        a, b = b, a
+    out = array('I')
+    lo = 0
+    for value in a:
+        lo = bisect_left(b, value, lo)
+        if lo == len(b):
+            break
+        if b[lo] == value:
+            out.append(value)
+    return out
+
+def _contains_run(tokens, phrase):
+    n = len(phrase)
+    return any(tokens[i:i + n] == phrase for i in range(len(tokens) - n + 1))
+
+def headword_forms(index):
+    """
+    Return {headword: surface forms that count as an example of it}
+    Single-word headwords are covered by the word or any of its inflected
+    forms ("work", "works", "working", "worked"); multi-word headwords by
+    the phrase itself
+    """
+    forms = {}
+    for entry in index.entries:
+        key = headword_key(entry['english'])
+        if not key:
+            continue
+        found = forms.setdefault(key, [key])
+        if ' ' not in key:
+            for form in inflect(key, entry['part_of_speech']):
+                if form not in found:
+                    found.append(form)
+    return forms
+
+class CorpusIndex:
+    """
+    Inverted index from tokens to sorted sentence IDs
+    Each sentence's token sequence is kept as well, so phrases can be
+    checked for adjacency and a changed sentence can be re-indexed
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._sentences = {}
+        self.source = None
+
+    def __len__(self):
+        return len(self._sentences)
+
+    def __contains__(self, sentence_id):
+        return sentence_id in self._sentences
+
+    def tokens(self, sentence_id):
+        return self._sentences[sentence_id]
+
+    def vocabulary(self):
+        """Return all indexed tokens"""
+        return self._postings.keys()
+
+    def add(self, sentence_id, text):
+        """
+        Index one sentence; a known ID with new text is re-indexed
+        Returns False when the sentence is already indexed unchanged
+        """
+        tokens = tuple(tokenize(text))
+        old = self._sentences.get(sentence_id)
+        if old == tokens:
+            return False
+        if old is not None:
+            self.remove(sentence_id)
+        self._sentences[sentence_id] = tokens
+        for token in set(tokens):
+            ids = self._postings.get(token)
+            if ids is None:
+                self._postings[token] = array('I', [sentence_id])
+            elif ids[-1] < sentence_id:
+                ids.append(sentence_id)
+            else:
+                insort(ids, sentence_id)
+        return True
+
+    def remove(self, sentence_id):
+        """Drop one sentence from the index"""
+        for token in set(self._sentences.pop(sentence_id)):
+            ids = self._postings[token]
+            del ids[bisect_left(ids, sentence_id)]
+            if not ids:
+                del self._postings[token]
+
+    def update(self, records, prune=False):
+        """
+        Index new and changed sentence records
+        With prune, records is the whole corpus and sentences not in it
+        are dropped
+        Returns (sentences indexed, sentences removed)
+        """
+        added = 0
+        seen = set()
+        for record in records:
+            seen.add(record['id'])
+            if self.add(record['id'], record['text']):
+                added += 1
+        removed = 0
+        if prune:
+            for sentence_id in [i for i in self._sentences if i not in seen]:
+                self.remove(sentence_id)
+                removed += 1
+        instrumentation.count('sentences_indexed', added)
+        instrumentation.count('sentences_removed', removed)
+        return added, removed
+
+    def sentences_with(self, word):
+        """
+        Sorted IDs of the sentences containing word, or every token of a
+        phrase next to each other
+        """
+        phrase = tuple(tokenize(word))
+        if not phrase:
+            return _EMPTY
+        ids = self._postings.get(phrase[0], _EMPTY)
+        if len(phrase) == 1:
+            return ids
+        for token in phrase[1:]:
+            ids = _intersect(ids, self._postings.get(token, _EMPTY))
+            if not ids:
+                return ids
+        return array('I', (i for i in ids if _contains_run(self._sentences[i], phrase)))
+
+    def coverage(self, forms):
+        """Return {headword: sorted IDs of the sentences covering it}"""
+        result = {}
+        for headword, surface in forms.items():
+            if len(surface) == 1:
+                result[headword] = self.sentences_with(surface[0])
+            else:
+                ids = set()
+                for form in surface:
+                    ids.update(self._postings.get(form, ()))
+                result[headword] = array('I', sorted(ids))
+        return result
+
+    def zero_coverage(self, forms, among=None):
+        """
+        Headwords with no covering sentence, in sorted order
+        With among (a set of sentence IDs, e.g. those already translated),
+        only those sentences count as examples
+        """
+        missing = []
+        for headword, ids in self.coverage(forms).items():
+            if among is None:
+                if not ids:
+                    missing.append(headword)
+            elif not any(i in among for i in ids):
+                missing.append(headword)
+        return sorted(missing)
+
+    def pick(self, forms, n, translated=()):
+        """
+        Greedily choose up to n sentences that together cover the most
+        headwords not yet covered by the translated sentences
+        Lazy greedy: a sentence's gain only shrinks as others are picked,
+        so a stale heap entry is re-scored and pushed back instead of
+        re-scoring every sentence each round
+        Returns [(sentence ID, [newly covered headwords])]
+        """
+        translated = set(translated)
+        covers = {}
+        for headword, ids in self.coverage(forms).items():
+            if any(i in translated for i in ids):
+                continue
+            for i in ids:
+                covers.setdefault(i, []).append(headword)
+
+        heap = [(-len(heads), i) for i, heads in covers.items() if i not in translated]
+        heapq.heapify(heap)
+        covered = set()
+        picks = []
+        while heap and len(picks) < n:
+            gain, i = heapq.heappop(heap)
+            new = [h for h in covers[i] if h not in covered]
+            if not new:
+                continue
+            if len(new) < -gain:
+                covers[i] = new
+                heapq.heappush(heap, (-len(new), i))
+                continue
+            covered.update(new)
+            picks.append((i, new))
+        return picks
+
+    def save(self, path):
+        """Write the index file"""
+        state = (INDEX_VERSION, self.source, self._postings, self._sentences)
+        with open(path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save()"""
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        if state[0] != INDEX_VERSION:
+            raise ValueError(f"{path} is not a version {INDEX_VERSION} corpus index")
+        corpus = cls()
+        _, corpus.source, corpus._postings, corpus._sentences = state
+        return corpus
+
+def _stamp(path):
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+def load_corpus_index(corpus_file='sentences_10k.json', index_file=None):
+    """
+    Load the saved index and bring it up to date with corpus_file
+    When the corpus has changed since the index was saved, every record
+    is read and tokenized but only new or changed sentences touch the
+    postings, and sentences no longer in the corpus are dropped; an
+    unchanged corpus is not read at all
+    Returns (index, sentences indexed, sentences removed)
+    """
+    index_file = index_file or os.path.splitext(corpus_file)[0] + '.corpus.index'
+    corpus = None
+    if os.path.exists(index_file):
+        try:
+            with instrumentation.stage('load'):
+                corpus = CorpusIndex.load(index_file)
+        except (ValueError, pickle.UnpicklingError, EOFError):
+            pass
+    corpus = corpus or CorpusIndex()
+
+    stamp = _stamp(corpus_file)
+    if corpus.source == stamp:
+        return corpus, 0, 0
+    with instrumentation.stage('index'):
+        added, removed = corpus.update(iter_sentence_records(corpus_file), prune=True)
+    corpus.source = stamp
+    with instrumentation.stage('save'):
+        corpus.save(index_file)
+    return corpus, added, removed
+
+def read_translated_ids(path):
+    """
+    Sentence IDs already translated, from the ID,Category,English,Banjara,
+    Timestamp CSV that collect.html downloads, or from a JSON list of IDs
+    or of records with an id field
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            return {int(row['ID']) for row in csv.DictReader(f) if row.get('ID', '').strip()}
+        items = json.load(f)
+    return {item['id'] if isinstance(item, dict) else int(item) for item in items}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the sentence corpus index for collection planning")
+    parser.add_argument('words', nargs='*', help="list the sentences containing these words")
+    parser.add_argument('--corpus', default='sentences_10k.json',
+                        help="corpus from generate_sentences.py (.json, .jsonl or .bin)")
+    parser.add_argument('--index', help="index file (default: CORPUS.corpus.index)")
+    parser.add_argument('--csv', default='dictionary_master_english.csv')
+    parser.add_argument('--translated', metavar='FILE',
+                        help="translations CSV downloaded from collect.html, or a JSON "
+                             "list of sentence IDs already translated")
+    parser.add_argument('--uncovered', action='store_true',
+                        help="list headwords with no example sentence")
+    parser.add_argument('--pick', type=int, default=0, metavar='N',
+                        help="choose N sentences covering the most uncovered headwords")
+    parser.add_argument('--limit', type=int, default=20, help="rows to print per query")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    with instrumentation.run('corpus_index', args.metrics, args.profile):
+        corpus, added, removed = load_corpus_index(args.corpus, args.index)
+        print(f"📚 {len(corpus):,} sentences, {len(corpus.vocabulary()):,} tokens indexed "
+              f"({added:,} new or changed, {removed:,} removed)")
+
+        for word in args.words:
+            ids = corpus.sentences_with(word)
+            shown = ', '.join(str(i) for i in ids[:args.limit])
+            more = f" (+{len(ids) - args.limit:,} more)" if len(ids) > args.limit else ''
+            print(f"🔍 '{word}': {len(ids):,} sentences {shown}{more}")
+
+        if args.uncovered or args.pick:
+            forms = headword_forms(load_index(args.csv))
+            translated = read_translated_ids(args.translated) if args.translated else None
+
+        if args.uncovered:
+            with instrumentation.stage('zero_coverage'):
+                missing = corpus.zero_coverage(forms, translated)
+            label = "translated examples" if translated is not None else "corpus sentences"
+            print(f"\n❓ {len(missing):,} of {len(forms):,} headwords have no {label}")
+            for headword in missing[:args.limit]:
+                print(f"  {headword}")
+
+        if args.pick:
+            with instrumentation.stage('pick'):
+                picks = corpus.pick(forms, args.pick, translated or ())
+            total = sum(len(new) for _, new in picks)
+            print(f"\n🎯 Translate next: {len(picks)} sentences covering {total:,} new headwords")
+            for i, new in picks[:args.limit]:
+                text = ' '.join(corpus.tokens(i))
+                print(f"  #{i}: {text}  (+{len(new)}: {', '.join(new[:6])})")
@@ -0,0 +1,203 @@
+"""
+Fuzzy Lookup Index
+Inverted indexes over the English headwords and banjara_english words of
+dictionary_master_english.csv, used to suggest close matches for
+out-of-vocabulary words without scanning the whole vocabulary.
+
+Each word is indexed under its deletion neighbourhood (every string
+left after deleting up to max_distance characters). Two words within
+edit distance k always share such a key, so a query only verifies the
+words filed under its own deletions, however large the vocabulary is.
+"""
+
+import argparse
+import random
+import time
+
+from banjara_dictionary import load_index, normalize
+
+def levenshtein(a, b, max_distance=None):
+    """
+    Edit distance between two strings (insert, delete, substitute)
+    With max_distance, stops early and returns max_distance + 1 once
+    the distance is known to be larger
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+def deletions(word, max_distance):
+    """Every string reachable from word by deleting up to max_distance characters"""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        results |= frontier
+    return results
+
+class DeletionIndex:
+    """
+    Inverted index from deletion variants to words
+    Queries up to max_distance look up the query's own deletion variants
+    and verify only the words found there
+    """
+
+    def __init__(self, words=(), max_distance=2):
+        self.max_distance = max_distance
+        self._index = {}
+        self._words = set()
+        self._longest = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return len(self._words)
+
+    def add(self, word):
+        if word in self._words:
+            return
+        self._words.add(word)
+        self._longest = max(self._longest, len(word))
+        for variant in deletions(word, self.max_distance):
+            self._index.setdefault(variant, []).append(word)
+
+    def search(self, word, max_distance=2, k=5, budget=None):
+        """
+        Return up to k (distance, word) pairs within max_distance, closest
+        first. With a budget in seconds the search stops when time runs
+        out and returns the best matches found so far.
+        Also returns the number of candidates verified.
+        Words longer than the longest indexed word plus max_distance cannot
+        match, and are rejected before building their neighbourhood, which
+        grows with the square of the word's length.
+        """
+        max_distance = min(max_distance, self.max_distance)
+        if len(word) > self._longest + max_distance:
+            return [], 0
+        deadline = time.perf_counter() + budget if budget else None
+        candidates = set()
+        for variant in deletions(word, max_distance):
+            candidates.update(self._index.get(variant, ()))
+
+        matches = []
+        for checked, candidate in enumerate(candidates, start=1):
+            distance = levenshtein(word, candidate, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+            if deadline and not checked % 32 and time.perf_counter() > deadline:
+                break
+        matches.sort()
+        return matches[:k], len(candidates)
+
+class FuzzyIndex:
+    """Fuzzy lookups over English headwords and banjara_english words"""
+
+    def __init__(self, index):
+        self.index = index
+        self.english = DeletionIndex(word for word in index.headwords() if ' ' not in word)
+        self.banjara = DeletionIndex(index.banjara_words())
+
+    def suggest(self, word, max_distance=None, k=5, budget=0.005, field='english'):
+        """
+        Return up to k (distance, word) candidates for word
+        max_distance defaults to 1 for words under 5 letters, else 2
+        """
+        word = normalize(word)
+        if max_distance is None:
+            max_distance = 1 if len(word) < 5 else 2
+        tree = self.english if field == 'english' else self.banjara
+        matches, _ = tree.search(word, max_distance, k, budget)
+        return matches
+
+    def lookup(self, word, **kwargs):
+        """Return (headword, banjara_english) for the closest English headword, or None"""
+        matches = self.suggest(word, k=1, **kwargs)
+        if not matches:
+            return None
+        headword = matches[0][1]
+        return headword, self.index.get(headword)
+
+def _mutate(word, rng, alphabet='abcdefghijklmnopqrstuvwxyz'):
+    chars = list(word)
+    for _ in range(rng.randint(1, 3)):
+        op = rng.randrange(3)
+        pos = rng.randrange(len(chars) + (op == 1))
+        if op == 0 and chars:
+            chars[pos] = rng.choice(alphabet)
+        elif op == 1:
+            chars.insert(pos, rng.choice(alphabet))
+        elif len(chars) > 1:
+            del chars[pos]
+    return ''.join(chars)
+
+def benchmark(words, scales=(1, 2, 4, 8), queries=200, max_distance=2, seed=0):
+    """
+    Time index queries against a linear scan as the vocabulary grows
+    Larger vocabularies are made by adding mutated copies of the real words
+    Returns one dict per scale
+    """
+    rng = random.Random(seed)
+    words = sorted(set(words))
+    probes = [_mutate(rng.choice(words), rng) for _ in range(queries)]
+    results = []
+    for scale in scales:
+        vocab = set(words)
+        while len(vocab) < len(words) * scale:
+            vocab.add(_mutate(rng.choice(words), rng))
+        vocab = sorted(vocab)
+        index = DeletionIndex(vocab, max_distance)
+
+        start = time.perf_counter()
+        checked = sum(index.search(probe, max_distance)[1] for probe in probes)
+        index_time = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        for probe in probes[:20]:
+            [w for w in vocab if levenshtein(probe, w, max_distance) <= max_distance]
+        scan_time = (time.perf_counter() - start) / 20
+
+        results.append({
+            'vocabulary': len(vocab),
+            'index_ms': index_time * 1000,
+            'scan_ms': scan_time * 1000,
+            'checked_fraction': checked / queries / len(vocab),
+        })
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fuzzy lookups over the Banjara dictionary")
+    parser.add_argument('words', nargs='*', help="words to find close matches for")
+    parser.add_argument('--csv', default='dictionary_master_english.csv')
+    parser.add_argument('--banjara', action='store_true', help="search banjara_english words")
+    parser.add_argument('--distance', type=int, help="maximum edit distance")
+    parser.add_argument('--bench', action='store_true',
+                        help="compare the index and a linear scan as the vocabulary grows")
+    args = parser.parse_args()
+
+    fuzzy = FuzzyIndex(load_index(args.csv))
+    print(f"📚 Indexed {len(fuzzy.english)} English and {len(fuzzy.banjara)} Banjara words")
+
+    for word in args.words:
+        field = 'banjara' if args.banjara else 'english'
+        matches = fuzzy.suggest(word, args.distance, field=field)
+        print(f"  {word}: " + (', '.join(f"{w} ({d})" for d, w in matches) or 'no match'))
+
+    if args.bench:
+        print("\n📊 Query time vs vocabulary size (edit distance 2):")
+        print(f"  {'words':>8} {'index':>10} {'scan':>10} {'checked':>8}")
+        english_words = [word for word in fuzzy.index.headwords() if ' ' not in word]
+        for row in benchmark(english_words):
+            print(f"  {row['vocabulary']:>8} {row['index_ms']:>8.3f}ms {row['scan_ms']:>8.3f}ms "
+                  f"{row['checked_fraction']:>8.2%}")
@@ -3,423 +3,713 @@ Generate 10,000 diverse English sentences for Banjara translation
 Categories: Greetings, Daily Life, Questions, Travel, Health, Food, etc.
 """
 
+import argparse
 import json
+import os
 import random
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import product
+from string import Formatter
 
-# Template-based sentence generation
-def generate_sentences():
-    sentences = []
-    sentence_id = 1
-    
-    # 1. GREETINGS (200)
-    greetings = [
-        "Hello", "Hi", "Good morning", "Good afternoon", "Good evening", "Good night",
-        "How are you?", "How are you doing?", "How is it going?", "What's up?",
-        "Nice to meet you", "Pleased to meet you", "Good to see you",
-        "Welcome", "Welcome back", "Long time no see",
-        "How have you been?", "How is your family?", "How is everyone?",
-        "Take care", "See you later", "See you soon", "Goodbye", "Bye",
-        "Have a good day", "Have a nice day", "Have a great day",
-        "Thank you", "Thanks", "Thank you very much", "Thanks a lot",
-        "You're welcome", "No problem", "My pleasure", "Anytime",
-        "Sorry", "I'm sorry", "Excuse me", "Pardon me", "I apologize",
-        "Please", "Please help me", "Could you please", "Would you mind",
-        "Bless you", "Congratulations", "Well done", "Good job",
-        "Happy birthday", "Happy new year", "Merry Christmas",
-        "Good luck", "All the best", "Best wishes"
-    ]
-    
-    for g in greetings:
-        sentences.append({"id": sentence_id, "category": "greeting", "text": g, "difficulty": "easy"})
-        sentence_id += 1
-    
-    # Add variations
-    names = ["mother", "father", "brother", "sister", "friend", "uncle", "aunt"]
-    for name in names:
-        for phrase in ["How is your", "Give my regards to your", "Say hello to your"]:
-            sentences.append({
-                "id": sentence_id,
-                "category": "greeting",
-                "text": f"{phrase} {name}?",
-                "difficulty": "easy"
-            })
-            sentence_id += 1
-    
-    # 2. DAILY LIFE (1500)
-    actions = ["eating", "drinking", "sleeping", "working", "studying", "reading", "writing",
-               "walking", "running", "sitting", "standing", "waiting", "playing", "watching",
-               "listening", "talking", "cooking", "cleaning", "washing", "resting"]
-    
-    for action in actions:
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"I am {action}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"He is {action}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"She is {action}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"They are {action}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    wants = ["food", "water", "tea", "coffee", "milk", "rice", "bread", "fruit", "help", "rest"]
-    for want in wants:
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"I want {want}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"I need {want}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"Do you want {want}?", "difficulty": "easy"})
-        sentence_id += 1
-    
-    feelings = ["happy", "sad", "angry", "tired", "hungry", "thirsty", "sick", "well", "fine", "busy"]
-    for feeling in feelings:
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"I am {feeling}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"I feel {feeling}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    weather = ["hot", "cold", "warm", "cool", "sunny", "cloudy", "rainy", "windy"]
-    for w in weather:
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"It is {w}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"It is very {w}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"It is too {w}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    times = ["morning", "afternoon", "evening", "night", "day", "today", "tomorrow", "yesterday"]
-    for t in times:
-        sentences.append({"id": sentence_id, "category": "daily_life", "text": f"In the {t}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    # 3. QUESTIONS (1200)
-    question_words = {
-        "What": ["is this", "is that", "is your name", "do you do", "do you want", "time is it",
-                 "day is it", "are you doing", "happened", "is wrong"],
-        "Where": ["is the bathroom", "is the market", "is the hospital", "is the station",
-                  "are you", "are you going", "do you live", "is it", "can I find"],
-        "When": ["are you coming", "will you come", "did you arrive", "is it", "does it start",
-                 "can I come", "should I come"],
-        "Why": ["are you late", "is this happening", "did you do that", "not", "are you crying"],
-        "How": ["are you", "do you do this", "much is this", "much does it cost", "far is it",
-                "long does it take", "old are you", "many are there"],
-        "Who": ["is this", "is that", "are you", "did this", "called", "will come"],
-        "Which": ["one", "way", "is better", "do you prefer", "is yours"]
-    }
-    
-    for q_word, endings in question_words.items():
-        for ending in endings:
-            sentences.append({
-                "id": sentence_id,
-                "category": "question",
-                "text": f"{q_word} {ending}?",
-                "difficulty": "medium"
-            })
-            sentence_id += 1
-    
-    yes_no_questions = [
-        "Do you understand?", "Can you help me?", "Is this correct?", "Are you sure?",
-        "Do you know?", "Can I come?", "May I come in?", "Is it ready?",
-        "Are you hungry?", "Do you have time?", "Can you speak English?",
-        "Do you have children?", "Are you married?", "Is it far?", "Is it expensive?"
-    ]
-    
-    for q in yes_no_questions:
-        sentences.append({"id": sentence_id, "category": "question", "text": q, "difficulty": "medium"})
-        sentence_id += 1
-    
-    # 4. COMMANDS (500)
-    commands = [
-        "Come here", "Go there", "Sit down", "Stand up", "Wait here", "Stop",
-        "Listen", "Look", "Watch", "Help me", "Give me", "Take this",
-        "Open the door", "Close the window", "Turn on the light", "Turn off the fan",
-        "Be quiet", "Be careful", "Hurry up", "Slow down", "Wake up", "Get up",
-        "Eat your food", "Drink water", "Take rest", "Go to sleep",
-        "Clean the room", "Wash your hands", "Call me", "Tell me"
-    ]
-    
-    for cmd in commands:
-        sentences.append({"id": sentence_id, "category": "command", "text": cmd, "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "command", "text": f"Please {cmd.lower()}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    # 5. FAMILY (500)
-    family_members = [
-        "father", "mother", "brother", "sister", "son", "daughter",
-        "grandfather", "grandmother", "uncle", "aunt", "cousin",
-        "husband", "wife", "child", "parent", "relative"
-    ]
-    
-    for member in family_members:
-        sentences.append({"id": sentence_id, "category": "family", "text": f"This is my {member}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "family", "text": f"Where is your {member}?", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "family", "text": f"My {member} is at home", "difficulty": "medium"})
-        sentence_id += 1
-    
-    numbers = ["one", "two", "three", "four", "five"]
-    for num in numbers:
-        sentences.append({"id": sentence_id, "category": "family", "text": f"I have {num} children", "difficulty": "medium"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "family", "text": f"I have {num} brothers", "difficulty": "medium"})
-        sentence_id += 1
-    
-    # 6. FOOD (800)
-    foods = [
-        "rice", "bread", "roti", "dal", "curry", "vegetable", "fruit", "meat", "chicken",
-        "fish", "egg", "milk", "tea", "coffee", "water", "juice", "sugar", "salt", "oil"
-    ]
-    
-    for food in foods:
-        sentences.append({"id": sentence_id, "category": "food", "text": f"I want {food}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "food", "text": f"I like {food}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "food", "text": f"I don't like {food}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "food", "text": f"Do you have {food}?", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "food", "text": f"Give me some {food}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    food_descriptions = [
-        "The food is delicious", "The food is good", "The food is bad",
-        "The food is hot", "The food is cold", "The food is spicy",
-        "I am vegetarian", "I don't eat meat", "I am hungry",
-        "Let's eat", "Time to eat", "What is for dinner?"
-    ]
-    
-    for desc in food_descriptions:
-        sentences.append({"id": sentence_id, "category": "food", "text": desc, "difficulty": "medium"})
-        sentence_id += 1
-    
-    # 7. TRAVEL (800)
-    places = [
-        "home", "work", "school", "market", "hospital", "temple", "mosque",
-        "church", "station", "airport", "bus stop", "city", "village"
-    ]
-    
-    for place in places:
-        sentences.append({"id": sentence_id, "category": "travel", "text": f"I am going to {place}", "difficulty": "medium"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "travel", "text": f"Where is the {place}?", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "travel", "text": f"How do I get to the {place}?", "difficulty": "medium"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "travel", "text": f"Is this the way to the {place}?", "difficulty": "medium"})
-        sentence_id += 1
-    
-    directions = [
-        "Turn left", "Turn right", "Go straight", "Go back",
-        "It is near", "It is far", "It is here", "It is there",
-        "I am lost", "Please help me", "Show me the way"
-    ]
-    
-    for direction in directions:
-        sentences.append({"id": sentence_id, "category": "travel", "text": direction, "difficulty": "medium"})
-        sentence_id += 1
-    
-    # 8. HEALTH (600)
-    body_parts = [
-        "head", "eyes", "ears", "nose", "mouth", "teeth", "throat", "neck",
-        "chest", "stomach", "back", "arms", "hands", "legs", "feet"
-    ]
-    
-    for part in body_parts:
-        sentences.append({"id": sentence_id, "category": "health", "text": f"My {part} hurts", "difficulty": "medium"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "health", "text": f"I have pain in my {part}", "difficulty": "medium"})
-        sentence_id += 1
-    
-    illnesses = [
-        "I am sick", "I have a fever", "I have a cold", "I have a cough",
-        "I have a headache", "I have a stomachache", "I am not well",
-        "I need medicine", "I need a doctor", "Where is the hospital?",
-        "Call a doctor", "I feel better", "I am getting better",
-        "Take rest", "Get well soon", "Are you okay?"
-    ]
-    
-    for illness in illnesses:
-        sentences.append({"id": sentence_id, "category": "health", "text": illness, "difficulty": "medium"})
-        sentence_id += 1
-    
-    # 9. SHOPPING (700)
-    items = [
-        "vegetables", "fruit", "clothes", "shoes", "bag", "phone", "book", "pen", "paper"
-    ]
-    
-    for item in items:
-        sentences.append({"id": sentence_id, "category": "shopping", "text": f"I want to buy {item}", "difficulty": "medium"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "shopping", "text": f"How much is this {item}?", "difficulty": "medium"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "shopping", "text": f"Do you have {item}?", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "shopping", "text": f"I need {item}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    shopping_phrases = [
-        "How much does this cost?", "This is too expensive", "This is cheap",
-        "Can you give a discount?", "I will buy this", "I will take it",
-        "Show me another one", "Do you have a bigger size?", "Do you have a smaller size?",
-        "What colors do you have?", "I like this", "I don't like this"
-    ]
-    
-    for phrase in shopping_phrases:
-        sentences.append({"id": sentence_id, "category": "shopping", "text": phrase, "difficulty": "medium"})
-        sentence_id += 1
-    
-    # 10. TIME (400)
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    for day in days:
-        sentences.append({"id": sentence_id, "category": "time", "text": f"Today is {day}", "difficulty": "easy"})
-        sentence_id += 1
-    
-    time_phrases = [
-        "What time is it?", "What day is it?", "What is the date?",
-        "Today is a good day", "Tomorrow I will go", "Yesterday I went",
-        "In the morning", "In the afternoon", "In the evening", "At night",
-        "Early morning", "Late night", "Right now", "Later", "Soon",
-        "Wait a minute", "Just a moment", "I am coming", "I will be there"
-    ]
-    
-    for phrase in time_phrases:
-        sentences.append({"id": sentence_id, "category": "time", "text": phrase, "difficulty": "easy"})
-        sentence_id += 1
-    
-    # 11. WORK & EDUCATION (600)
-    occupations = ["teacher", "doctor", "farmer", "worker", "driver", "shopkeeper", "student"]
-    for job in occupations:
-        sentences.append({"id": sentence_id, "category": "work", "text": f"I am a {job}", "difficulty": "easy"})
-        sentence_id += 1
-        sentences.append({"id": sentence_id, "category": "work", "text": f"My father is a {job}", "difficulty": "medium"})
-        sentence_id += 1
-    
-    work_phrases = [
-        "I am working", "I am studying", "I go to school", "I go to college",
-        "Where do you work?", "What do you do?", "I am learning",
-        "I know", "I don't know", "I understand", "I don't understand",
-        "Please explain", "Can you teach me?", "I am a student"
-    ]
-    
-    for phrase in work_phrases:
-        sentences.append({"id": sentence_id, "category": "work", "text": phrase, "difficulty": "medium"})
-        sentence_id += 1
-    
-    # 12. COMPLEX SENTENCES (1500)
-    # If/Then patterns
-    if_conditions = [
-        ("If it rains", "I will stay home"),
-        ("If you come", "I will be happy"),
-        ("If I have time", "I will help you"),
-        ("If you want", "you can come"),
-        ("If he asks", "tell him the truth")
-    ]
-    
-    for if_part, then_part in if_conditions:
-        sentences.append({
-            "id": sentence_id,
-            "category": "complex",
-            "text": f"{if_part}, {then_part}",
-            "difficulty": "hard"
-        })
-        sentence_id += 1
-    
-    # Because patterns
-    because_patterns = [
-        ("I am staying home", "because it is raining"),
-        ("I am happy", "because you came"),
-        ("I cannot come", "because I am busy"),
-        ("I am late", "because the bus was late"),
-        ("I am tired", "because I worked all day")
-    ]
-    
-    for main, reason in because_patterns:
-        sentences.append({
-            "id": sentence_id,
-            "category": "complex",
-            "text": f"{main} {reason}",
-            "difficulty": "hard"
-        })
-        sentence_id += 1
-    
-    # Compound sentences with "and", "but", "or"
-    compound_patterns = [
-        "I like tea and coffee",
-        "Come here and sit down",
-        "He is tall but thin",
-        "I want to come but I am busy",
-        "Do you want tea or coffee?",
-        "Is it near or far?",
-        "I can go today or tomorrow",
-        "My father works hard and my mother cooks well",
-        "The food is good but expensive",
-        "Call me or send a message"
-    ]
-    
-    for pattern in compound_patterns:
-        sentences.append({"id": sentence_id, "category": "complex", "text": pattern, "difficulty": "hard"})
-        sentence_id += 1
-    
-    # Fill remaining up to 10,000 with more variations
-    while sentence_id <= 10000:
-        # Add more daily conversation patterns
-        misc_sentences = [
-            "Can you repeat that?",
-            "I didn't hear you",
-            "Speak slowly please",
-            "I will tell you later",
-            "Don't worry about it",
-            "Everything is okay",
-            "It's not a problem",
-            "Let me think about it",
-            "I forgot",
-            "I remember now",
-            "That's correct",
-            "You are right",
-            "I agree with you",
-            "I disagree",
-            "Maybe you are right",
-            "I think so",
-            "I don't think so",
-            "It's possible",
-            "It's impossible",
-            "I hope so"
-        ]
-        
-        for sent in misc_sentences:
-            if sentence_id > 10000:
-                break
-            sentences.append({
-                "id": sentence_id,
-                "category": "conversation",
-                "text": sent,
-                "difficulty": "medium"
-            })
-            sentence_id += 1
-    
-    return sentences[:10000]  # Ensure exactly 10,000
+import instrumentation
+from sentence_corpus import SentenceCorpus, write_corpus
 
-def main():
-    print("Generating 10,000 English sentences...")
-    sentences = generate_sentences()
-    
-    # Save to JSON
-    output_file = r'i:\Banjara AI\sentences_10k.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(sentences, f, indent=2, ensure_ascii=False)
+# ===================================
+# SLOT LISTS
+# ===================================
+GREETINGS = [
+    "Hello", "Hi", "Good morning", "Good afternoon", "Good evening", "Good night",
+    "How are you?", "How are you doing?", "How is it going?", "What's up?",
+    "Nice to meet you", "Pleased to meet you", "Good to see you",
+    "Welcome", "Welcome back", "Long time no see",
+    "How have you been?", "How is your family?", "How is everyone?",
+    "Take care", "See you later", "See you soon", "Goodbye", "Bye",
+    "Have a good day", "Have a nice day", "Have a great day",
+    "Thank you", "Thanks", "Thank you very much", "Thanks a lot",
+    "You're welcome", "No problem", "My pleasure", "Anytime",
+    "Sorry", "I'm sorry", "Excuse me", "Pardon me", "I apologize",
+    "Please", "Please help me", "Could you please", "Would you mind",
+    "Bless you", "Congratulations", "Well done", "Good job",
+    "Happy birthday", "Happy new year", "Merry Christmas",
+    "Good luck", "All the best", "Best wishes"
+]
+SALUTATIONS = ["Hello", "Good morning", "Good evening", "Good night", "Thank you",
+               "Goodbye", "Welcome", "Take care", "See you later", "Happy birthday"]
+GREETING_PHRASES = ["How is your", "Give my regards to your", "Say hello to your"]
+NAMES = ["mother", "father", "brother", "sister", "friend", "uncle", "aunt"]
+
+SUBJECTS = ["I am", "He is", "She is", "They are"]
+ACTIONS = ["eating", "drinking", "sleeping", "working", "studying", "reading", "writing",
+           "walking", "running", "sitting", "standing", "waiting", "playing", "watching",
+           "listening", "talking", "cooking", "cleaning", "washing", "resting"]
+WANTS = ["food", "water", "tea", "coffee", "milk", "rice", "bread", "fruit", "help", "rest"]
+FEELINGS = ["happy", "sad", "angry", "tired", "hungry", "thirsty", "sick", "well", "fine", "busy"]
+WEATHER = ["hot", "cold", "warm", "cool", "sunny", "cloudy", "rainy", "windy"]
+TIMES = ["morning", "afternoon", "evening", "night", "day", "today", "tomorrow", "yesterday"]
+PARTS_OF_DAY = ["morning", "afternoon", "evening", "night"]
+
+QUESTION_WORDS = {
+    "What": ["is this", "is that", "is your name", "do you do", "do you want", "time is it",
+             "day is it", "are you doing", "happened", "is wrong"],
+    "Where": ["is the bathroom", "is the market", "is the hospital", "is the station",
+              "are you", "are you going", "do you live", "is it", "can I find"],
+    "When": ["are you coming", "will you come", "did you arrive", "is it", "does it start",
+             "can I come", "should I come"],
+    "Why": ["are you late", "is this happening", "did you do that", "not", "are you crying"],
+    "How": ["are you", "do you do this", "much is this", "much does it cost", "far is it",
+            "long does it take", "old are you", "many are there"],
+    "Who": ["is this", "is that", "are you", "did this", "called", "will come"],
+    "Which": ["one", "way", "is better", "do you prefer", "is yours"]
+}
+YES_NO_QUESTIONS = [
+    "Do you understand?", "Can you help me?", "Is this correct?", "Are you sure?",
+    "Do you know?", "Can I come?", "May I come in?", "Is it ready?",
+    "Are you hungry?", "Do you have time?", "Can you speak English?",
+    "Do you have children?", "Are you married?", "Is it far?", "Is it expensive?"
+]
+
+COMMANDS = [
+    "Come here", "Go there", "Sit down", "Stand up", "Wait here", "Stop",
+    "Listen", "Look", "Watch", "Help me", "Give me", "Take this",
+    "Open the door", "Close the window", "Turn on the light", "Turn off the fan",
+    "Be quiet", "Be careful", "Hurry up", "Slow down", "Wake up", "Get up",
+    "Eat your food", "Drink water", "Take rest", "Go to sleep",
+    "Clean the room", "Wash your hands", "Call me", "Tell me"
+]
+
+FAMILY_MEMBERS = [
+    "father", "mother", "brother", "sister", "son", "daughter",
+    "grandfather", "grandmother", "uncle", "aunt", "cousin",
+    "husband", "wife", "child", "parent", "relative"
+]
+NUMBERS = ["one", "two", "three", "four", "five"]
+
+FOODS = [
+    "rice", "bread", "roti", "dal", "curry", "vegetable", "fruit", "meat", "chicken",
+    "fish", "egg", "milk", "tea", "coffee", "water", "juice", "sugar", "salt", "oil"
+]
+FOOD_DESCRIPTIONS = [
+    "The food is delicious", "The food is good", "The food is bad",
+    "The food is hot", "The food is cold", "The food is spicy",
+    "I am vegetarian", "I don't eat meat", "I am hungry",
+    "Let's eat", "Time to eat", "What is for dinner?"
+]
+
+PLACES = [
+    "home", "work", "school", "market", "hospital", "temple", "mosque",
+    "church", "station", "airport", "bus stop", "city", "village"
+]
+DIRECTIONS = [
+    "Turn left", "Turn right", "Go straight", "Go back",
+    "It is near", "It is far", "It is here", "It is there",
+    "I am lost", "Please help me", "Show me the way"
+]
+
+BODY_PARTS = [
+    "head", "eyes", "ears", "nose", "mouth", "teeth", "throat", "neck",
+    "chest", "stomach", "back", "arms", "hands", "legs", "feet"
+]
+ILLNESSES = [
+    "I am sick", "I have a fever", "I have a cold", "I have a cough",
+    "I have a headache", "I have a stomachache", "I am not well",
+    "I need medicine", "I need a doctor", "Where is the hospital?",
+    "Call a doctor", "I feel better", "I am getting better",
+    "Take rest", "Get well soon", "Are you okay?"
+]
+
+ITEMS = [
+    "vegetables", "fruit", "clothes", "shoes", "bag", "phone", "book", "pen", "paper"
+]
+SHOPPING_PHRASES = [
+    "How much does this cost?", "This is too expensive", "This is cheap",
+    "Can you give a discount?", "I will buy this", "I will take it",
+    "Show me another one", "Do you have a bigger size?", "Do you have a smaller size?",
+    "What colors do you have?", "I like this", "I don't like this"
+]
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+TIME_PHRASES = [
+    "What time is it?", "What day is it?", "What is the date?",
+    "Today is a good day", "Tomorrow I will go", "Yesterday I went",
+    "In the morning", "In the afternoon", "In the evening", "At night",
+    "Early morning", "Late night", "Right now", "Later", "Soon",
+    "Wait a minute", "Just a moment", "I am coming", "I will be there"
+]
+
+OCCUPATIONS = ["teacher", "doctor", "farmer", "worker", "driver", "shopkeeper", "student"]
+WORK_PHRASES = [
+    "I am working", "I am studying", "I go to school", "I go to college",
+    "Where do you work?", "What do you do?", "I am learning",
+    "I know", "I don't know", "I understand", "I don't understand",
+    "Please explain", "Can you teach me?", "I am a student"
+]
+
+IF_CLAUSES = ["If it rains", "If you come", "If I have time", "If you want", "If he asks"]
+THEN_CLAUSES = ["I will stay home", "I will be happy", "I will help you",
+                "you can come", "tell him the truth"]
+BECAUSE_MAINS = ["I am staying home", "I am happy", "I cannot come", "I am late", "I am tired"]
+BECAUSE_REASONS = ["because it is raining", "because you came", "because I am busy",
+                   "because the bus was late", "because I worked all day"]
+COMPOUND_PATTERNS = [
+    "I like tea and coffee",
+    "Come here and sit down",
+    "He is tall but thin",
+    "I want to come but I am busy",
+    "Do you want tea or coffee?",
+    "Is it near or far?",
+    "I can go today or tomorrow",
+    "My father works hard and my mother cooks well",
+    "The food is good but expensive",
+    "Call me or send a message"
+]
+
+MISC_SENTENCES = [
+    "Can you repeat that?",
+    "I didn't hear you",
+    "Speak slowly please",
+    "I will tell you later",
+    "Don't worry about it",
+    "Everything is okay",
+    "It's not a problem",
+    "Let me think about it",
+    "I forgot",
+    "I remember now",
+    "That's correct",
+    "You are right",
+    "I agree with you",
+    "I disagree",
+    "Maybe you are right",
+    "I think so",
+    "I don't think so",
+    "It's possible",
+    "It's impossible",
+    "I hope so"
+]
+
+# Slot name -> values, referenced as {slot} in TEMPLATES
+SLOTS = {
+    "greeting": GREETINGS,
+    "salutation": SALUTATIONS,
+    "greeting_phrase": GREETING_PHRASES,
+    "name": NAMES,
+    "subject": SUBJECTS,
+    "action": ACTIONS,
+    "want": WANTS,
+    "feeling": FEELINGS,
+    "weather": WEATHER,
+    "time": TIMES,
+    "part_of_day": PARTS_OF_DAY,
+    "question": [f"{q_word} {ending}?" for q_word, endings in QUESTION_WORDS.items()
+                 for ending in endings] + YES_NO_QUESTIONS,
+    "command": COMMANDS,
+    "command_lower": [cmd.lower() for cmd in COMMANDS],
+    "family_member": FAMILY_MEMBERS,
+    "number": NUMBERS,
+    "food": FOODS,
+    "food_description": FOOD_DESCRIPTIONS,
+    "place": PLACES,
+    "direction": DIRECTIONS,
+    "body_part": BODY_PARTS,
+    "illness": ILLNESSES,
+    "item": ITEMS,
+    "shopping_phrase": SHOPPING_PHRASES,
+    "day": DAYS,
+    "time_phrase": TIME_PHRASES,
+    "occupation": OCCUPATIONS,
+    "work_phrase": WORK_PHRASES,
+    "if_clause": IF_CLAUSES,
+    "then_clause": THEN_CLAUSES,
+    "because_main": BECAUSE_MAINS,
+    "because_reason": BECAUSE_REASONS,
+    "compound": COMPOUND_PATTERNS,
+    "misc": MISC_SENTENCES,
+}
+
+# ===================================
+# TEMPLATES
+# Category -> (template, difficulty); each template expands to the
+# cross product of the slots it references
+# ===================================
+TEMPLATES = {
+    "greeting": [
+        ("{greeting}", "easy"),
+        ("{greeting_phrase} {name}?", "easy"),
+        ("{salutation}, {name}", "easy"),
+    ],
+    "daily_life": [
+        ("{subject} {action}", "easy"),
+        ("I want {want}", "easy"),
+        ("I need {want}", "easy"),
+        ("Do you want {want}?", "easy"),
+        ("I am {feeling}", "easy"),
+        ("I feel {feeling}", "easy"),
+        ("It is {weather}", "easy"),
+        ("It is very {weather}", "easy"),
+        ("It is too {weather}", "easy"),
+        ("In the {time}", "easy"),
+        ("{subject} {action} in the {part_of_day}", "medium"),
+        ("{subject} {action} with my {family_member}", "medium"),
+        ("I feel {feeling} in the {part_of_day}", "medium"),
+        ("It is {weather} in the {part_of_day}", "medium"),
+        ("{subject} {feeling}", "easy"),
+        ("{subject} not {action}", "easy"),
+        ("{subject} {action} at home", "medium"),
+    ],
+    "question": [
+        ("{question}", "medium"),
+        ("Is your {family_member} {action}?", "medium"),
+        ("Is your {family_member} {feeling}?", "medium"),
+        ("Why are you {feeling}?", "medium"),
+        ("When are you going to the {place}?", "medium"),
+        ("Why is your {family_member} {feeling}?", "medium"),
+        ("Does your {family_member} like {food}?", "medium"),
+    ],
+    "command": [
+        ("{command}", "easy"),
+        ("Please {command_lower}", "easy"),
+        ("{command}, {name}", "easy"),
+    ],
+    "family": [
+        ("This is my {family_member}", "easy"),
+        ("Where is your {family_member}?", "easy"),
+        ("My {family_member} is at home", "medium"),
+        ("I have {number} children", "medium"),
+        ("I have {number} brothers", "medium"),
+        ("My {family_member} is {action}", "medium"),
+        ("My {family_member} is {feeling}", "medium"),
+    ],
+    "food": [
+        ("I want {food}", "easy"),
+        ("I like {food}", "easy"),
+        ("I don't like {food}", "easy"),
+        ("Do you have {food}?", "easy"),
+        ("Give me some {food}", "easy"),
+        ("{food_description}", "medium"),
+        ("I want {food} in the {part_of_day}", "medium"),
+        ("My {family_member} likes {food}", "medium"),
+        ("My {family_member} doesn't like {food}", "medium"),
+    ],
+    "travel": [
+        ("I am going to {place}", "medium"),
+        ("Where is the {place}?", "easy"),
+        ("How do I get to the {place}?", "medium"),
+        ("Is this the way to the {place}?", "medium"),
+        ("{direction}", "medium"),
+        ("My {family_member} is going to {place}", "medium"),
+        ("I am going to {place} in the {part_of_day}", "medium"),
+        ("My {family_member} is going to {place} in the {part_of_day}", "medium"),
+    ],
+    "health": [
+        ("My {body_part} hurts", "medium"),
+        ("I have pain in my {body_part}", "medium"),
+        ("{illness}", "medium"),
+        ("My {family_member}'s {body_part} hurts", "medium"),
+        ("My {body_part} hurts in the {part_of_day}", "medium"),
+        ("My {family_member}'s {body_part} hurts in the {part_of_day}", "medium"),
+    ],
+    "shopping": [
+        ("I want to buy {item}", "medium"),
+        ("How much is this {item}?", "medium"),
+        ("Do you have {item}?", "easy"),
+        ("I need {item}", "easy"),
+        ("{shopping_phrase}", "medium"),
+        ("Where can I buy {item}?", "medium"),
+        ("I want to buy {item} for my {family_member}", "medium"),
+        ("My {family_member} needs {item}", "medium"),
+    ],
+    "time": [
+        ("Today is {day}", "easy"),
+        ("{time_phrase}", "easy"),
+        ("Tomorrow is {day}", "easy"),
+        ("Yesterday was {day}", "easy"),
+        ("See you on {day}", "easy"),
+        ("I will go to {place} on {day}", "medium"),
+        ("I will come on {day}", "easy"),
+        ("My {family_member} will come on {day}", "medium"),
+    ],
+    "work": [
+        ("I am a {occupation}", "easy"),
+        ("My {family_member} is a {occupation}", "medium"),
+        ("{work_phrase}", "medium"),
+        ("I want to be a {occupation}", "medium"),
+        ("Is your {family_member} a {occupation}?", "medium"),
+        ("The {occupation} is {action}", "medium"),
+    ],
+    "complex": [
+        ("{if_clause}, {then_clause}", "hard"),
+        ("{because_main} {because_reason}", "hard"),
+        ("{compound}", "hard"),
+        ("I am {feeling} because I am {action}", "hard"),
+        ("My {family_member} is {feeling} because it is {weather}", "hard"),
+        ("If it is {weather}, my {family_member} will stay home", "hard"),
+        ("If it is {weather}, I will go to {place}", "hard"),
+        ("I am {action} because I am {feeling}", "hard"),
+    ],
+    "conversation": [
+        ("{misc}", "medium"),
+        ("{misc}, {name}", "medium"),
+    ],
+}
+
+# Long templates for corpora beyond what TEMPLATES can produce. Their
+# cross products run to millions, so they are never expanded up front:
+# each combination is addressed by index. Every slot sits between fixed
+# words, so no two combinations (and no TEMPLATES sentence) share a text.
+EXTENDED_TEMPLATES = {
+    "daily_life": [
+        ("{subject} {action} with my {family_member} in the {part_of_day} on {day}", "hard"),
+    ],
+    "food": [
+        ("My {family_member} is cooking {food} for the {occupation} in the {part_of_day} on {day}",
+         "hard"),
+    ],
+    "health": [
+        ("My {family_member}'s {body_part} hurts after {action} in the {part_of_day} on {day}",
+         "hard"),
+    ],
+    "travel": [
+        ("{if_clause}, my {family_member} will go to {place} on {day} in the {part_of_day}",
+         "hard"),
+    ],
+    "complex": [
+        ("{subject} {feeling} because my {family_member} is {action} at {place} on {day} "
+         "in the {part_of_day}", "hard"),
+    ],
+}
+
+# ===================================
+# TEMPLATE EXPANSION
+# ===================================
+def _template_slots(template):
+    return [field for _, field, _, _ in Formatter().parse(template) if field]
+
+def expand_template(template):
+    """Yield every text a template produces, in slot-list order"""
+    names = _template_slots(template)
+    for values in product(*(SLOTS[name] for name in names)):
+        yield template.format(**dict(zip(names, values)))
+
+def expand_category(category, seen=None):
+    """
+    Yield unique (category, text, difficulty) records for one category
+    Pass a shared seen set to dedupe across categories
+    """
+    if seen is None:
+        seen = set()
+    for template, difficulty in TEMPLATES[category]:
+        for text in expand_template(template):
+            if text not in seen:
+                seen.add(text)
+                yield category, text, difficulty
+
+def iter_unique_records():
+    """Yield every unique (category, text, difficulty) record, category by category"""
+    seen = set()
+    for category in TEMPLATES:
+        yield from expand_category(category, seen)
+
+@lru_cache(maxsize=None)
+def _base_pool():
+    return tuple(iter_unique_records())
+
+def _extended_spaces():
+    """[(first index, category, template, difficulty, slot names, slot sizes)]"""
+    spaces = []
+    offset = 0
+    for category, templates in EXTENDED_TEMPLATES.items():
+        for template, difficulty in templates:
+            names = _template_slots(template)
+            sizes = [len(SLOTS[name]) for name in names]
+            spaces.append((offset, category, template, difficulty, names, sizes))
+            size = 1
+            for n in sizes:
+                size *= n
+            offset += size
+    return spaces, offset
+
+_EXTENDED_SPACES, EXTENDED_SIZE = _extended_spaces()
+_EXTENDED_STARTS = [space[0] for space in _EXTENDED_SPACES]
+
+def extended_record(index):
+    """(category, text, difficulty) of one EXTENDED_TEMPLATES combination, in product() order"""
+    offset, category, template, difficulty, names, sizes = \
+        _EXTENDED_SPACES[bisect_right(_EXTENDED_STARTS, index) - 1]
+    index -= offset
+    values = {}
+    for name, size in zip(reversed(names), reversed(sizes)):
+        index, i = divmod(index, size)
+        values[name] = SLOTS[name][i]
+    return category, template.format(**values), difficulty
+
+def _mix(seed, n):
+    """splitmix64 of (seed, n): a cheap per-position random number"""
+    x = (seed * 0x9E3779B97F4A7C15 + n + 1) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
+
+def category_capacity():
+    """Return the maximum number of unique sentences each category can produce"""
+    capacity = {category: 0 for category in TEMPLATES}
+    for category, _, _ in _base_pool():
+        capacity[category] += 1
+    for i, (offset, category, *_) in enumerate(_EXTENDED_SPACES):
+        end = _EXTENDED_STARTS[i + 1] if i + 1 < len(_EXTENDED_STARTS) else EXTENDED_SIZE
+        capacity[category] = capacity.get(category, 0) + end - offset
+    return capacity
+
+def shard_bounds(count, shards, shard):
+    """Return the [start, end) offsets of one shard within count records"""
+    size = -(-count // shards)
+    start = min(shard * size, count)
+    return start, min(start + size, count)
+
+def iter_shard(shard, shards, count=10000, seed=0):
+    """
+    Lazily yield the records of one shard of a count-sentence corpus
+    The first sentences are a seeded sample of the TEMPLATES sentences,
+    the same for every shard. Past those, position j takes one
+    combination from the j-th of (count - base) equal strata of
+    EXTENDED_TEMPLATES, picked by a hash of (seed, j), so a shard only
+    computes its own slice. ids are the shard's start offset + position + 1
+    """
+    base = _base_pool()
+    if count > len(base) + EXTENDED_SIZE:
+        raise ValueError(f"Only {len(base) + EXTENDED_SIZE:,} unique sentences available, "
+                         f"{count:,} requested")
+    start, end = shard_bounds(count, shards, shard)
+    base_count = min(count, len(base))
+
+    if start < base_count:
+        picks = sorted(random.Random(seed).sample(range(len(base)), base_count))
+        for position in range(start, min(end, base_count)):
+            category, text, difficulty = base[picks[position]]
+            yield {"id": position + 1, "category": category, "text": text,
+                   "difficulty": difficulty}
+
+    extended_count = count - base_count
+    for position in range(max(start, base_count), end):
+        j = position - base_count
+        low = j * EXTENDED_SIZE // extended_count
+        high = (j + 1) * EXTENDED_SIZE // extended_count
+        category, text, difficulty = extended_record(low + _mix(seed, j) % (high - low))
+        yield {"id": position + 1, "category": category, "text": text, "difficulty": difficulty}
+
+def iter_sentences(count=10000, seed=0):
+    """
+    Lazily yield count unique sentence records, sampled with a seeded RNG
+    Up to the TEMPLATES capacity records keep their category order;
+    ids run from 1 to count
+    """
+    return iter_shard(0, 1, count, seed)
+
+def generate_sentences(count=10000, seed=0):
+    """Return count unique sentence records as a list"""
+    return list(iter_sentences(count, seed))
+
+def write_sentences(sentences, output_file):
+    """
+    Write sentence records as they are produced
+    .jsonl gets one record per line; .json gets a JSON array written
+    incrementally, one record per line; .bin gets the compact columnar
+    format from sentence_corpus
+    Returns (category counts, difficulty counts)
+    """
+    if output_file.lower().endswith('.bin'):
+        return write_corpus(sentences, output_file)
     
-    # Print statistics
     categories = {}
     difficulties = {}
+    as_array = output_file.lower().endswith('.json')
     
-    for sent in sentences:
-        cat = sent['category']
-        diff = sent['difficulty']
-        categories[cat] = categories.get(cat, 0) + 1
-        difficulties[diff] = difficulties.get(diff, 0) + 1
+    with open(output_file, 'w', encoding='utf-8') as f:
+        if as_array:
+            f.write('[')
+        for i, sent in enumerate(sentences):
+            line = json.dumps(sent, ensure_ascii=False)
+            if as_array:
+                f.write(('\n  ' if i == 0 else ',\n  ') + line)
+            else:
+                f.write(line + '\n')
+            
+            cat = sent['category']
+            diff = sent['difficulty']
+            categories[cat] = categories.get(cat, 0) + 1
+            difficulties[diff] = difficulties.get(diff, 0) + 1
+        if as_array:
+            f.write('\n]\n')
+    
+    return categories, difficulties
+
+def shard_path(output_file, shard):
+    """Return the file name for one shard of output_file"""
+    root, ext = os.path.splitext(output_file)
+    return f"{root}.shard{shard:04d}{ext}"
+
+def _write_shard(job):
+    output_file, shard, shards, count, seed = job
+    path = shard_path(output_file, shard)
+    categories, difficulties = write_sentences(iter_shard(shard, shards, count, seed), path)
+    return path, categories, difficulties
+
+def generate_shards(output_file, count=10000, seed=0, shards=4, workers=None):
+    """
+    Write each shard to its own file from a process pool
+    Returns the shard paths plus merged category and difficulty counts
+    """
+    jobs = [(output_file, shard, shards, count, seed) for shard in range(shards)]
+    paths = []
+    categories = {}
+    difficulties = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, cats, diffs in pool.map(_write_shard, jobs):
+            paths.append(path)
+            for cat, n in cats.items():
+                categories[cat] = categories.get(cat, 0) + n
+            for diff, n in diffs.items():
+                difficulties[diff] = difficulties.get(diff, 0) + n
+    return paths, categories, difficulties
+
+def _iter_records(path, start=0):
+    """
+    Yield (position, record) from a shard file, beginning at start
+    Positions are byte offsets for JSON/JSONL shards and record indexes
+    for binary shards
+    """
+    if path.lower().endswith('.bin'):
+        with SentenceCorpus(path) as corpus:
+            for i in range(start, len(corpus)):
+                yield i, corpus[i]
+        return
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        for line in iter(f.readline, b''):
+            text = line.strip().rstrip(b',')
+            if text and text not in b'[]':
+                yield offset, json.loads(text)
+            offset = f.tell()
+
+def _iter_category_runs(paths):
+    """Yield (category, path, position) for each run of one category in the shards"""
+    for path in paths:
+        current = None
+        for position, record in _iter_records(path):
+            if record['category'] != current:
+                current = record['category']
+                yield current, path, position
+
+def _iter_run(path, position, category):
+    for _, record in _iter_records(path, position):
+        if record['category'] != category:
+            return
+        yield record
+
+def _iter_runs(category, runs):
+    for path, position in runs:
+        yield from _iter_run(path, position, category)
+
+def merge_shards(paths, output_file, mode='concat'):
+    """
+    Merge shard files into one output file
+    'concat' keeps shard order; 'interleave' takes one record from each
+    category in turn. Only one record per category is held in memory.
+    """
+    if mode == 'concat':
+        records = (record for path in paths for _, record in _iter_records(path))
+        return write_sentences(records, output_file)
+
+    runs = {}
+    for category, path, offset in _iter_category_runs(paths):
+        runs.setdefault(category, []).append((path, offset))
+    queues = [_iter_runs(category, category_runs) for category, category_runs in runs.items()]
+
+    def interleaved():
+        active = queues
+        while active:
+            still_active = []
+            for queue in active:
+                record = next(queue, None)
+                if record is not None:
+                    yield record
+                    still_active.append(queue)
+            active = still_active
+
+    return write_sentences(interleaved(), output_file)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate English sentences for Banjara translation")
+    parser.add_argument('-o', '--output', default='sentences_10k.jsonl',
+                        help="output file (.jsonl, .json for a JSON array, or .bin for the binary corpus)")
+    parser.add_argument('-n', '--count', type=int, default=10000,
+                        help="number of unique sentences to generate")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="random seed for sampling sentences")
+    parser.add_argument('--capacity', action='store_true',
+                        help="print how many unique sentences each category can produce")
+    parser.add_argument('--shards', type=int, default=1,
+                        help="split the corpus into this many shard files")
+    parser.add_argument('--shard', type=int,
+                        help="write only this shard (0-based) instead of all of them")
+    parser.add_argument('--workers', type=int,
+                        help="worker processes for sharded generation (default: all cores)")
+    parser.add_argument('--merge', choices=['concat', 'interleave'],
+                        help="merge the shard files into OUTPUT")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+    
+    if args.count < 0:
+        parser.error("--count must not be negative")
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if args.shard is not None and not 0 <= args.shard < args.shards:
+        parser.error(f"--shard must be between 0 and {args.shards - 1} (--shards {args.shards})")
+    if args.merge and (args.shards < 2 or args.shard is not None):
+        parser.error("--merge needs --shards greater than 1 and no --shard")
+    
+    capacity = category_capacity()
+    if args.capacity:
+        print("Unique sentences by category:")
+        for cat, count in capacity.items():
+            print(f"  {cat}: {count}")
+        print(f"  total: {sum(capacity.values())}")
+        return
+    if args.count > sum(capacity.values()):
+        parser.error(f"only {sum(capacity.values()):,} unique sentences available, "
+                     f"{args.count:,} requested")
+    
+    with instrumentation.run('generate_sentences', args.metrics, args.profile):
+        print(f"Generating {args.count:,} English sentences...")
+        outputs = [args.output]
+        if args.shard is not None:
+            with instrumentation.stage('generate'):
+                output_file, categories, difficulties = _write_shard(
+                    (args.output, args.shard, args.shards, args.count, args.seed))
+            outputs = [output_file]
+        elif args.shards > 1:
+            with instrumentation.stage('generate'):
+                paths, categories, difficulties = generate_shards(
+                    args.output, args.count, args.seed, args.shards, args.workers)
+            print(f"Wrote {len(paths)} shards: {paths[0]} ... {paths[-1]}")
+            output_file = paths[0]
+            outputs = paths
+            if args.merge:
+                with instrumentation.stage('merge'):
+                    categories, difficulties = merge_shards(paths, args.output, args.merge)
+                output_file = args.output
+                outputs = paths + [args.output]
+        else:
+            with instrumentation.stage('generate'):
+                sentences = iter_sentences(args.count, args.seed)
+                categories, difficulties = write_sentences(sentences, args.output)
+            output_file = args.output
+        instrumentation.count('records_written', sum(categories.values()))
+        instrumentation.count('bytes_out', sum(os.path.getsize(path) for path in outputs))
     
-    print(f"\nGenerated {len(sentences)} sentences")
+    # Print statistics
+    print(f"\nGenerated {sum(categories.values())} sentences")
     print("\nBy Category:")
     for cat, count in sorted(categories.items()):
         print(f"  {cat}: {count}")
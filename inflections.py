@@ -0,0 +1,156 @@
+"""
+Inflection Table
+Build step that expands every verb and noun in dictionary_master_english.csv
+into its inflected English surface forms (-s/-es/-ies, -ing, -ed, doubled
+consonants) and merges in the grammar tables, giving one flat
+surface form -> translation map. Translation then needs a single hash
+probe per token.
+"""
+
+import argparse
+import json
+import os
+
+from banjara_dictionary import headword_key, load_index
+
+FORMS_VERSION = 1
+
+VOWELS = set('aeiou')
+
+# Suffixes added to the Banjara translation, same as translateWords
+ING_SUFFIX = ' raha'
+ED_SUFFIX = ' gaya'
+
+# Parts of speech that get -s, -ing and -ed forms
+INFLECTED_POS = {'noun', 'verb', 'unknown'}
+
+def _is_consonant(char):
+    return char.isalpha() and char not in VOWELS
+
+def _doubles_final_consonant(word):
+    """
+    Consonant-vowel-consonant ending in a one-syllable word:
+    run -> running, stop -> stopped (but not fix, play or open)
+    """
+    if len(word) < 3 or word[-1] in 'wxy':
+        return False
+    if not (_is_consonant(word[-3]) and word[-2] in VOWELS and _is_consonant(word[-1])):
+        return False
+    vowel_groups = sum(1 for i, char in enumerate(word)
+                       if char in VOWELS and (i == 0 or word[i - 1] not in VOWELS))
+    return vowel_groups == 1
+
+def plural(word):
+    """Third-person singular / plural: -s, -es or -ies"""
+    if word.endswith(('s', 'x', 'z', 'ch', 'sh', 'o')):
+        return word + 'es'
+    if len(word) > 1 and word.endswith('y') and _is_consonant(word[-2]):
+        return word[:-1] + 'ies'
+    return word + 's'
+
+def present_participle(word):
+    """-ing form"""
+    if word.endswith('ie'):
+        return word[:-2] + 'ying'
+    if word.endswith('e') and not word.endswith(('ee', 'ye', 'oe')) and len(word) > 2:
+        return word[:-1] + 'ing'
+    if _doubles_final_consonant(word):
+        return word + word[-1] + 'ing'
+    return word + 'ing'
+
+def past_tense(word):
+    """Regular -ed form"""
+    if word.endswith('e'):
+        return word + 'd'
+    if len(word) > 1 and word.endswith('y') and _is_consonant(word[-2]):
+        return word[:-1] + 'ied'
+    if _doubles_final_consonant(word):
+        return word + word[-1] + 'ed'
+    return word + 'ed'
+
+def inflect(word, part_of_speech):
+    """
+    Return {surface form: suffix for the translation} for one headword
+    Verbs and nouns get -s, -ing and -ed forms: the scanned dictionary tags
+    many verbs ("walk", "work", "wash") as nouns. Adjectives, numerals and
+    conjunctions are not inflected.
+    """
+    forms = {}
+    if part_of_speech in INFLECTED_POS:
+        forms[plural(word)] = ''
+        forms[present_participle(word)] = ING_SUFFIX
+        forms[past_tense(word)] = ED_SUFFIX
+    forms.pop(word, None)
+    return forms
+
+def build_surface_forms(index, grammar):
+    """
+    Return {surface form: [translation, kind]}
+    Grammar tables win over dictionary headwords, which win over
+    inflected forms; earlier CSV rows win over later ones
+    """
+    forms = {}
+    for table in ('pronouns', 'auxiliaries', 'prepositions'):
+        for word, trans in grammar[table].items():
+            forms.setdefault(word, [trans, 'grammar'])
+
+    for key in index.headwords():
+        if ' ' not in key:
+            forms.setdefault(key, [index.get(key), 'dictionary'])
+
+    for entry in index.entries:
+        key = headword_key(entry['english'])
+        if not key or ' ' in key:
+            continue
+        trans = index.get(key)
+        for form, suffix in inflect(key, entry['part_of_speech']).items():
+            forms.setdefault(form, [trans + suffix, 'inflected'])
+
+    for word in grammar['ignore']:
+        forms.pop(word, None)
+    return forms
+
+def forms_path(csv_file):
+    """Surface-form table file for a dictionary CSV, kept next to it"""
+    return os.path.splitext(csv_file)[0] + '.forms.json'
+
+def save_surface_forms(forms, path, version=None):
+    """Write the prebuilt surface-form table"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': FORMS_VERSION, 'dictionary_version': version, 'forms': forms},
+                  f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+def load_surface_forms(index, grammar, forms_file=None):
+    """
+    Load the prebuilt table for this dictionary version, rebuilding and
+    saving it when it is missing or was built from another dictionary
+    """
+    if forms_file and os.path.exists(forms_file):
+        with open(forms_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == FORMS_VERSION and data.get('dictionary_version') == index.version:
+            return data['forms']
+    forms = build_surface_forms(index, grammar)
+    if forms_file:
+        save_surface_forms(forms, forms_file, index.version)
+    return forms
+
+if __name__ == "__main__":
+    from translator import GRAMMAR
+
+    parser = argparse.ArgumentParser(description="Build the inflected surface-form table")
+    parser.add_argument('--csv', default='dictionary_master_english.csv')
+    parser.add_argument('--output', help="table file (default: CSV name with .forms.json)")
+    args = parser.parse_args()
+
+    index = load_index(args.csv)
+    forms = build_surface_forms(index, GRAMMAR)
+    output = args.output or forms_path(args.csv)
+    save_surface_forms(forms, output, index.version)
+
+    kinds = {}
+    for _, kind in forms.values():
+        kinds[kind] = kinds.get(kind, 0) + 1
+    print(f"✅ Wrote {len(forms)} surface forms to {output}")
+    for kind, count in sorted(kinds.items()):
+        print(f"  {kind}: {count}")
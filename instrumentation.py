@@ -0,0 +1,166 @@
+"""
+Pipeline Instrumentation
+Per-stage timers and counters for the dictionary, corpus, translation and
+TTS scripts, plus optional cProfile / tracemalloc capture. Everything is
+off until a run is started with --metrics / --profile or the
+BANJARA_METRICS / BANJARA_PROFILE environment variables; while off,
+stage() returns a shared no-op context and count() returns immediately.
+
+    with instrumentation.run('simplify_phonetics', args.metrics, args.profile):
+        with instrumentation.stage('load'):
+            ...
+        instrumentation.count('rows_read', len(rows))
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+
+METRICS_ENV = 'BANJARA_METRICS'
+PROFILE_ENV = 'BANJARA_PROFILE'
+PROFILE_MODES = ('cprofile', 'tracemalloc', 'all')
+
+# Functions and allocation sites kept in the metrics file
+TOP_ENTRIES = 25
+
+class Metrics:
+    """Stage timings and counters collected during one run"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.time()
+        self.stages = {}
+        self.counters = {}
+
+    def add_time(self, name, seconds):
+        stage = self.stages.get(name)
+        if stage is None:
+            self.stages[name] = [1, seconds]
+        else:
+            stage[0] += 1
+            stage[1] += seconds
+
+    def as_dict(self):
+        return {
+            'run': self.name,
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'wall_seconds': time.time() - self.started,
+            'stages': {name: {'calls': calls, 'seconds': seconds}
+                       for name, (calls, seconds) in self.stages.items()},
+            'counters': dict(self.counters),
+        }
+
+class _Stage:
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+# Metrics of the active run, None while instrumentation is off
+_active = None
+
+def enabled():
+    return _active is not None
+
+def stage(name):
+    """Context manager timing one stage; a no-op while instrumentation is off"""
+    if _active is None:
+        return _NULL_STAGE
+    return _Stage(_active, name)
+
+def count(name, n=1):
+    """Add n to a counter"""
+    if _active is not None:
+        _active.counters[name] = _active.counters.get(name, 0) + n
+
+def add_arguments(parser):
+    """Add --metrics and --profile to a script's argument parser"""
+    parser.add_argument('--metrics', metavar='FILE',
+                        help=f"write stage timings and counters to FILE (or set {METRICS_ENV})")
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help=f"also capture a cProfile and/or tracemalloc profile "
+                             f"(or set {PROFILE_ENV})")
+
+def _profile_summary(profiler):
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [{'function': f"{os.path.basename(path)}:{line}({func})",
+             'calls': calls, 'total_seconds': total, 'cumulative_seconds': cumulative}
+            for (path, line, func), (_, calls, total, cumulative, _) in rows[:TOP_ENTRIES]]
+
+def _memory_summary():
+    current, peak = tracemalloc.get_traced_memory()
+    top = tracemalloc.take_snapshot().statistics('lineno')[:TOP_ENTRIES]
+    return {
+        'current_bytes': current,
+        'peak_bytes': peak,
+        'top': [{'site': str(stat.traceback), 'bytes': stat.size, 'blocks': stat.count}
+                for stat in top],
+    }
+
+@contextlib.contextmanager
+def run(name, metrics_file=None, profile=None):
+    """
+    Collect metrics for the enclosed run and write them to metrics_file
+    Falls back to the environment variables; with only a profile mode set,
+    metrics go to NAME.metrics.json. cProfile data is also saved next to
+    the metrics file as .prof for pstats / snakeviz.
+    Yields the Metrics object, or None when instrumentation stays off
+    """
+    global _active
+    metrics_file = metrics_file or os.environ.get(METRICS_ENV)
+    profile = profile or os.environ.get(PROFILE_ENV)
+    if profile and profile not in PROFILE_MODES:
+        raise ValueError(f"{PROFILE_ENV} must be one of {', '.join(PROFILE_MODES)}")
+    if not (metrics_file or profile) or _active is not None:
+        yield _active
+        return
+
+    metrics_file = metrics_file or f"{name}.metrics.json"
+    _active = metrics = Metrics(name)
+    profiler = None
+    if profile in ('cprofile', 'all'):
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if profile in ('tracemalloc', 'all'):
+        tracemalloc.start()
+    try:
+        yield metrics
+    finally:
+        _active = None
+        report = metrics.as_dict()
+        if profiler is not None:
+            profiler.disable()
+            prof_file = os.path.splitext(metrics_file)[0] + '.prof'
+            profiler.dump_stats(prof_file)
+            report['profile'] = {'file': prof_file, 'top': _profile_summary(profiler)}
+        if profile in ('tracemalloc', 'all'):
+            report['memory'] = _memory_summary()
+            tracemalloc.stop()
+        with open(metrics_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📈 Metrics written to {metrics_file}")
@@ -0,0 +1,102 @@
+"""
+Load Test for the Translation Service
+Opens concurrent keep-alive connections to translation_service.py and
+reports throughput and latency percentiles
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+def load_sentences(path):
+    """Load sentence texts from a JSON array or JSONL corpus"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            return [json.loads(line)['text'] for line in f if line.strip()]
+        return [record['text'] for record in json.load(f)]
+
+async def _request(reader, writer, host, method, path, payload):
+    body = json.dumps(payload).encode('utf-8')
+    writer.write(
+        (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+         f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode('latin-1')
+        + body)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+async def _client(host, port, sentences, offset, step, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(offset, len(sentences), step):
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, host, 'POST', '/translate',
+                                       {'text': sentences[i]})
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+async def run_single(host, port, sentences, concurrency):
+    """Send every sentence as its own request over concurrency connections"""
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, sentences, offset, concurrency, latencies, errors)
+        for offset in range(concurrency)
+    ))
+    return time.perf_counter() - start, sorted(latencies), errors
+
+async def run_batch(host, port, sentences):
+    """Send all sentences in one /translate/batch request"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        start = time.perf_counter()
+        status, body = await _request(reader, writer, host, 'POST', '/translate/batch',
+                                      {'sentences': sentences})
+        elapsed = time.perf_counter() - start
+    finally:
+        writer.close()
+    return elapsed, status, len(json.loads(body).get('results', []))
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+async def main(args):
+    sentences = load_sentences(args.corpus)
+    if args.requests:
+        sentences = (sentences * (args.requests // len(sentences) + 1))[:args.requests]
+
+    print(f"🚀 {len(sentences)} single requests over {args.concurrency} connections...")
+    elapsed, latencies, errors = await run_single(args.host, args.port, sentences, args.concurrency)
+    print(f"  {len(latencies) / elapsed:,.0f} requests/s, {len(errors)} errors")
+    print(f"  latency p50 {_percentile(latencies, 0.50) * 1000:.2f} ms, "
+          f"p99 {_percentile(latencies, 0.99) * 1000:.2f} ms, "
+          f"max {latencies[-1] * 1000:.2f} ms")
+
+    print(f"\n📦 One batch request with {len(sentences)} sentences...")
+    elapsed, status, count = await run_batch(args.host, args.port, sentences)
+    print(f"  HTTP {status}, {count} results in {elapsed * 1000:.1f} ms "
+          f"({count / elapsed:,.0f} sentences/s)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the Banjara translation service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--corpus', default='sentences_10k.json')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--requests', type=int, help="number of single requests (default: corpus size)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,219 @@
+"""
+Clip Preprocessing
+Batch clean-up of the recordings in "Banjara TTS": trims leading and
+trailing silence, normalizes loudness (RMS target with a peak ceiling)
+and resamples every clip to one rate, writing 16-bit mono WAVs back into
+the library. Clips are processed in parallel worker processes, and a
+content-hash manifest skips clips unchanged since the last run.
+Uses NumPy when it is installed and plain Python otherwise.
+"""
+
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from audio_bank import read_wav, resample, to_mono
+from banjara_dictionary import file_hash
+from banjara_tts import CLIP_DIRS, iter_clip_files, wav_header
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MANIFEST_VERSION = 1
+
+DEFAULT_SETTINGS = {
+    'rate': 48000,          # output sample rate
+    'threshold_db': -45.0,  # windows quieter than this count as silence
+    'window_ms': 10.0,      # RMS window for silence detection
+    'pad_ms': 30.0,         # silence kept before the first and after the last loud window
+    'rms_db': -20.0,        # loudness target
+    'peak_db': -1.0,        # gain is capped so peaks stay below this
+}
+
+def _amplitude(db):
+    return 10 ** (db / 20)
+
+def _clean_numpy(samples, rate, settings):
+    x = np.frombuffer(samples.tobytes(), dtype=np.int16).astype(np.float64)
+    target = settings['rate']
+    if rate != target and len(x):
+        count = max(1, int(len(x) * target / rate))
+        x = np.interp(np.arange(count) * (rate / target), np.arange(len(x)), x)
+
+    window = max(1, int(target * settings['window_ms'] / 1000))
+    pad = int(target * settings['pad_ms'] / 1000)
+    frames = len(x) // window
+    rms = np.sqrt(np.mean(x[:frames * window].reshape(frames, window) ** 2, axis=1))
+    loud = np.flatnonzero(rms >= _amplitude(settings['threshold_db']) * 32768)
+    if not len(loud):
+        return array('h', x.astype(np.int16).tobytes())
+    x = x[max(0, loud[0] * window - pad):min(len(x), (loud[-1] + 1) * window + pad)]
+
+    gain = min(_amplitude(settings['rms_db']) * 32768 / np.sqrt(np.mean(x ** 2)),
+               _amplitude(settings['peak_db']) * 32767 / np.abs(x).max())
+    x = np.clip(np.round(x * gain), -32768, 32767).astype(np.int16)
+    return array('h', x.tobytes())
+
+def _clean_python(samples, rate, settings):
+    target = settings['rate']
+    samples = resample(samples, rate, target)
+
+    window = max(1, int(target * settings['window_ms'] / 1000))
+    pad = int(target * settings['pad_ms'] / 1000)
+    threshold = (_amplitude(settings['threshold_db']) * 32768) ** 2 * window
+    starts = range(0, len(samples) - window + 1, window)
+
+    def loud(start):
+        return sum(v * v for v in samples[start:start + window]) >= threshold
+
+    first = next((start for start in starts if loud(start)), None)
+    if first is None:
+        return samples
+    last = next(start for start in reversed(starts) if loud(start))
+    samples = samples[max(0, first - pad):min(len(samples), last + window + pad)]
+
+    rms = math.sqrt(sum(v * v for v in samples) / len(samples))
+    peak = max(max(samples), -min(samples))
+    gain = min(_amplitude(settings['rms_db']) * 32768 / rms,
+               _amplitude(settings['peak_db']) * 32767 / peak)
+    return array('h', (max(-32768, min(32767, round(v * gain))) for v in samples))
+
+def clean_clip(samples, rate, settings=DEFAULT_SETTINGS):
+    """
+    Resample mono 16-bit samples to settings['rate'], trim leading and
+    trailing silence and normalize loudness
+    Clips with no window above the silence threshold are only resampled
+    """
+    clean = _clean_numpy if np is not None else _clean_python
+    return clean(samples, rate, settings)
+
+def _write_wav(path, samples, rate):
+    if sys.byteorder == 'big':
+        samples = array('h', samples)
+        samples.byteswap()
+    data = samples.tobytes()
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(wav_header(1, 2, rate, len(data)))
+        f.write(data)
+    os.replace(tmp, path)
+
+def _process_clip(task):
+    """
+    Clean one clip; runs in a worker process
+    Returns (source, output, bytes before, bytes after, ms before, ms after,
+    output hash, error)
+    """
+    source, output, settings = task
+    try:
+        before_bytes = os.path.getsize(source)
+        channels, rate, samples = read_wav(source)
+        if not channels or not rate:
+            raise ValueError(f"invalid format: {channels} channels at {rate} Hz")
+        samples = to_mono(samples, channels)
+        before_ms = len(samples) * 1000 / rate
+        cleaned = clean_clip(samples, rate, settings)
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        _write_wav(output, cleaned, settings['rate'])
+    except (OSError, ValueError, struct.error) as error:
+        return source, output, 0, 0, 0.0, 0.0, None, str(error)
+    after_ms = len(cleaned) * 1000 / settings['rate']
+    return (source, output, before_bytes, os.path.getsize(output), before_ms, after_ms,
+            file_hash(output), None)
+
+def preprocess_library(root='Banjara TTS', output_dir=None, manifest_file=None,
+                       workers=None, settings=DEFAULT_SETTINGS, force=False):
+    """
+    Clean every clip under root, in place unless output_dir is given
+    A manifest keyed by clip path stores each clip's source and output
+    hashes; clips whose current file matches either are skipped, as long
+    as the settings are the same as on the last run
+    Returns a stats dict
+    """
+    output_dir = output_dir or root
+    manifest_file = manifest_file or os.path.join(output_dir, '.preprocess_manifest.json')
+
+    previous = {}
+    if not force and os.path.exists(manifest_file):
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION and manifest.get('settings') == settings:
+            previous = manifest['clips']
+
+    clips = {}
+    hashes = {}
+    tasks = []
+    for _, source in iter_clip_files(root, CLIP_DIRS):
+        rel = os.path.relpath(source, root)
+        output = os.path.join(output_dir, rel)
+        hashes[source] = file_hash(source)
+        old = previous.get(rel)
+        if old is not None and os.path.exists(output) and hashes[source] in old:
+            clips[rel] = old
+        else:
+            tasks.append((source, output, settings))
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_process_clip, tasks, chunksize=4))
+    else:
+        results = [_process_clip(task) for task in tasks]
+
+    stats = {'cleaned': 0, 'unchanged': len(clips), 'failed': [],
+             'bytes_saved': 0, 'ms_saved': 0.0}
+    for source, output, before_bytes, after_bytes, before_ms, after_ms, digest, error in results:
+        rel = os.path.relpath(source, root)
+        if error:
+            stats['failed'].append((rel, error))
+            continue
+        stats['cleaned'] += 1
+        stats['bytes_saved'] += before_bytes - after_bytes
+        stats['ms_saved'] += before_ms - after_ms
+        clips[rel] = [hashes[source], digest]
+
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'settings': settings, 'clips': clips},
+                  f, ensure_ascii=False, indent=1, sort_keys=True)
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Trim, normalize and resample the TTS clips")
+    parser.add_argument('--clips', default='Banjara TTS', help="clip library directory")
+    parser.add_argument('--output', help="write cleaned clips here instead of in place")
+    parser.add_argument('--manifest', help="content-hash manifest "
+                        "(default: OUTPUT/.preprocess_manifest.json)")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="worker processes (0 = all cores)")
+    parser.add_argument('--rate', type=int, default=DEFAULT_SETTINGS['rate'])
+    parser.add_argument('--threshold', type=float, default=DEFAULT_SETTINGS['threshold_db'],
+                        help="silence threshold in dBFS")
+    parser.add_argument('--rms', type=float, default=DEFAULT_SETTINGS['rms_db'],
+                        help="loudness target in dBFS RMS")
+    parser.add_argument('--peak', type=float, default=DEFAULT_SETTINGS['peak_db'],
+                        help="peak ceiling in dBFS")
+    parser.add_argument('--force', action='store_true', help="reprocess every clip")
+    args = parser.parse_args()
+
+    settings = dict(DEFAULT_SETTINGS, rate=args.rate, threshold_db=args.threshold,
+                    rms_db=args.rms, peak_db=args.peak)
+    print(f"🎚️ Preprocessing clips with {'NumPy' if np is not None else 'plain Python'}...")
+    start = time.perf_counter()
+    stats = preprocess_library(args.clips, args.output, args.manifest, args.workers,
+                               settings, args.force)
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ Cleaned {stats['cleaned']} clips, {stats['unchanged']} unchanged "
+          f"in {elapsed:.1f}s")
+    print(f"💾 Saved {stats['bytes_saved'] / 1024:,.0f} KB and "
+          f"{stats['ms_saved']:,.0f} ms of audio")
+    for rel, error in stats['failed']:
+        print(f"⚠️ Skipped {rel}: {error}")
@@ -0,0 +1,208 @@
+"""
+Compact Binary Sentence Corpus
+Columnar storage for generated sentences: category and difficulty as
+dictionary-encoded codes, texts in one UTF-8 blob with an offsets array.
+Records can be read from a memory-mapped file without parsing the rest.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+
+MAGIC = b'BNJS'
+VERSION = 1
+
+# magic, version, reserved, record count, name table size, text blob size
+HEADER = struct.Struct('<4sHHIII')
+
+def _pad(n):
+    return -n % 4
+
+def write_corpus(records, output_file):
+    """
+    Write sentence records to the binary corpus format as they arrive
+    Texts are spooled to a temporary file, so only the small per-record
+    columns are held in memory
+    Returns (category counts, difficulty counts)
+    """
+    ids = array('I')
+    category_codes = array('B')
+    difficulty_codes = array('B')
+    offsets = array('I', [0])
+    category_index = {}
+    difficulty_index = {}
+    categories = {}
+    difficulties = {}
+
+    with tempfile.TemporaryFile() as blob:
+        for record in records:
+            cat = record['category']
+            diff = record.get('difficulty', '')
+            categories[cat] = categories.get(cat, 0) + 1
+            difficulties[diff] = difficulties.get(diff, 0) + 1
+            if len(categories) > 256 or len(difficulties) > 256:
+                raise ValueError("At most 256 categories and difficulties are supported")
+
+            ids.append(record['id'])
+            category_codes.append(category_index.setdefault(cat, len(category_index)))
+            difficulty_codes.append(difficulty_index.setdefault(diff, len(difficulty_index)))
+            text = record['text'].encode('utf-8')
+            blob.write(text)
+            offsets.append(offsets[-1] + len(text))
+
+        names = json.dumps({'categories': list(categories),
+                            'difficulties': list(difficulties)}).encode('utf-8')
+        names += b' ' * _pad(len(names))
+        count = len(ids)
+
+        with open(output_file, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, count, len(names), offsets[-1]))
+            f.write(names)
+            for column in (ids, category_codes, difficulty_codes):
+                f.write(column.tobytes())
+            f.write(b'\0' * _pad(2 * count))
+            f.write(offsets.tobytes())
+            blob.seek(0)
+            while True:
+                chunk = blob.read(1 << 20)
+                if not chunk:
+                    break
+                f.write(chunk)
+
+    return categories, difficulties
+
+class SentenceCorpus:
+    """
+    Memory-mapped reader for files written by write_corpus
+    corpus[i] returns record i as a dict, touching only its own bytes
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, names_size, blob_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} sentence corpus")
+
+        pos = HEADER.size
+        names = json.loads(self._mm[pos:pos + names_size])
+        self.categories = names['categories']
+        self.difficulties = names['difficulties']
+        pos += names_size
+
+        view = memoryview(self._mm)
+        self._ids = view[pos:pos + 4 * count].cast('I')
+        pos += 4 * count
+        self._category_codes = view[pos:pos + count]
+        pos += count
+        self._difficulty_codes = view[pos:pos + count]
+        pos += count + _pad(2 * count)
+        self._offsets = view[pos:pos + 4 * (count + 1)].cast('I')
+        pos += 4 * (count + 1)
+        self._blob = view[pos:pos + blob_size]
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("sentence index out of range")
+        return {
+            "id": self._ids[i],
+            "category": self.categories[self._category_codes[i]],
+            "text": self.text(i),
+            "difficulty": self.difficulties[self._difficulty_codes[i]],
+        }
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def text(self, i):
+        """Return only the text of record i"""
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], 'utf-8')
+
+    def close(self):
+        for name in ('_ids', '_category_codes', '_difficulty_codes', '_offsets', '_blob'):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def load_records(input_file):
+    """Load sentence records from a JSON array or JSONL file"""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        if input_file.lower().endswith('.jsonl'):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+def convert(input_file, output_file):
+    """Convert sentences_10k.json (or JSONL) to the binary corpus format"""
+    categories, _ = write_corpus(load_records(input_file), output_file)
+    return sum(categories.values())
+
+def compare(json_file, binary_file, repeat=5):
+    """
+    Compare file size and the time to get at one record in each format
+    JSON has to be parsed in full; the binary corpus is opened and indexed
+    """
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    def from_json():
+        records = load_records(json_file)
+        return records[len(records) // 2]
+
+    expected = from_json()
+    expected.setdefault('difficulty', '')
+
+    def from_binary():
+        with SentenceCorpus(binary_file) as corpus:
+            return corpus[len(corpus) // 2]
+
+    if expected != from_binary():
+        raise ValueError("Binary corpus does not match the JSON records")
+    return {
+        'json_bytes': os.path.getsize(json_file),
+        'binary_bytes': os.path.getsize(binary_file),
+        'json_seconds': best(from_json),
+        'binary_seconds': best(from_binary),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert sentences to the binary corpus format")
+    parser.add_argument('input', nargs='?', default='sentences_10k.json')
+    parser.add_argument('output', nargs='?', default='sentences_10k.bin')
+    args = parser.parse_args()
+
+    print(f"Converting {args.input}...")
+    count = convert(args.input, args.output)
+    print(f"✅ Wrote {count} sentences to {args.output}")
+
+    result = compare(args.input, args.output)
+    print("\n📊 Size / load time:")
+    print(f"  JSON:   {result['json_bytes']:>10,} bytes  {result['json_seconds'] * 1000:8.2f} ms (full parse)")
+    print(f"  Binary: {result['binary_bytes']:>10,} bytes  {result['binary_seconds'] * 1000:8.2f} ms (open + 1 record)")
+    print(f"  {result['json_bytes'] / result['binary_bytes']:.1f}x smaller")
@@ -3,125 +3,313 @@ Simplify Phonetic Transliterations
 Converts special characters and diacritical marks to plain English letters
 """
 
+import argparse
+import csv
+import hashlib
 import json
+import os
 import re
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+import instrumentation
+
+# Character mappings for phonetic transliteration
+MAPPINGS = {
+    # Vowels with diacritics
+    'ā': 'a', 'á': 'a', 'à': 'a', 'ă': 'a', 'ą': 'a',
+    'ē': 'e', 'é': 'e', 'è': 'e', 'ě': 'e', 'ę': 'e',
+    'ī': 'i', 'í': 'i', 'ì': 'i', 'î': 'i',
+    'ō': 'o', 'ó': 'o', 'ò': 'o', 'ô': 'o', 'ǭ': 'o',
+    'ū': 'u', 'ú': 'u', 'ù': 'u', 'û': 'u',
+    
+    # Consonants with diacritics
+    'ḍ': 'd', 'ḍ': 'd', 'đ': 'd',
+    'ṭ': 't', 'ț': 't',
+    'ṇ': 'n', 'ñ': 'n', 'ń': 'n',
+    'ṣ': 's', 'ś': 's', 'š': 's',
+    'ṛ': 'r', 'ř': 'r',
+    'ḷ': 'l', 'ĺ': 'l',
+    'ṁ': 'm', 'ṃ': 'm',
+    'ṅ': 'ng',
+    'ñ': 'ny',
+    'ḥ': 'h',
+    'ǘ': 'u',
+    'ǯ': 'j',
+    'ǳ': 'ti',
+    'ǵ': 'ni',
+    'Ǭ': 'ch',
+    'ǽ': 'mi',
+    'Ǯ': 'j',
+    'Ƕ': 'n',
+    'Ƿ': 'p',
+    'Ĳ': 'n',
+    'ĵ': 'bh',
+    'ķ': 'y',
+    'Ĺ': 'l',
+    'Ľ': 's',
+    'ĭ': 'dh',
+    'İ': 'd',
+    'ı': 'dh',
+    'Ĩ': 'ch',
+    'ĩ': 'ch',
+    'Ħ': 'g',
+    'ȇ': 'vi',
+    'Ȁ': 'm',
+    'Ȃ': 'y',
+    'ȃ': 'l',
+    'Ȅ': 'l',
+    'ȅ': 'l',
+    'Ȇ': 'l',
+    'ȏ': 'h',
+    'Ȏ': 's',
+    'ț': 'h',
+    'Ț': 't',
+    'Ĵ': 'ph',
+    'ǹ': 'bh',
+    'Ǹ': 'ph',
+    'ǻ': 'bh',
+    'Ǻ': 'b',
+    'Ǽ': 'bh',
+    'Ǿ': 'm',
+    'ǿ': 'm',
+    'Ȉ': 'v',
+    'Ȋ': 'sh',
+    'ȋ': 'sh',
+    'Ȍ': 'sh',
+    'Ȉ': 'v',
+    
+    # Special characters
+    'ṁ': 'm', 'm̐': 'm', 'ṅ': 'ng', 'n̄': 'n',
+    'ḍ': 'd', 'ṭ': 't', 'ḷ': 'l', 'ṛ': 'r',
+    'ś': 'sh', 'ṣ': 'sh',
+}
+
+def _strip_marks(text):
+    """
+    Remove diacritical marks and anything that is not a plain letter or space
+    """
+    result = ''.join(c for c in unicodedata.normalize('NFD', text)
+                     if unicodedata.category(c) != 'Mn')
+    return re.sub(r'[^a-zA-Z\s]', '', result).lower()
+
+class _TranslationTable(dict):
+    """
+    str.translate table built from MAPPINGS
+    Characters not in MAPPINGS are resolved on first use and cached
+    """
+
+    def __missing__(self, codepoint):
+        value = _strip_marks(chr(codepoint))
+        self[codepoint] = value
+        return value
+
+# Built once at import time: single characters go through str.translate,
+# multi-codepoint sequences (m̐, n̄) through one compiled alternation
+_TABLE = _TranslationTable(
+    (ord(old_char), _strip_marks(new_char))
+    for old_char, new_char in MAPPINGS.items() if len(old_char) == 1
+)
+_TABLE.update((ord(c), _strip_marks(c)) for c in map(chr, range(128)))
+_SEQUENCES = {old_char: _strip_marks(new_char)
+              for old_char, new_char in MAPPINGS.items() if len(old_char) > 1}
+_SEQUENCE_RE = re.compile('|'.join(
+    re.escape(seq) for seq in sorted(_SEQUENCES, key=len, reverse=True)))
 
 def simplify_phonetic(text):
     """
     Convert phonetic transliteration to simple English letters
     Removes all diacritical marks and special characters
     """
-    # Define character mappings
-    mappings = {
-        # Vowels with diacritics
-        'ā': 'a', 'á': 'a', 'à': 'a', 'ă': 'a', 'ą': 'a',
-        'ē': 'e', 'é': 'e', 'è': 'e', 'ě': 'e', 'ę': 'e',
-        'ī': 'i', 'í': 'i', 'ì': 'i', 'î': 'i',
-        'ō': 'o', 'ó': 'o', 'ò': 'o', 'ô': 'o', 'ǭ': 'o',
-        'ū': 'u', 'ú': 'u', 'ù': 'u', 'û': 'u',
-        
-        # Consonants with diacritics
-        'ḍ': 'd', 'ḍ': 'd', 'đ': 'd',
-        'ṭ': 't', 'ț': 't',
-        'ṇ': 'n', 'ñ': 'n', 'ń': 'n',
-        'ṣ': 's', 'ś': 's', 'š': 's',
-        'ṛ': 'r', 'ř': 'r',
-        'ḷ': 'l', 'ĺ': 'l',
-        'ṁ': 'm', 'ṃ': 'm',
-        'ṅ': 'ng',
-        'ñ': 'ny',
-        'ḥ': 'h',
-        'ǘ': 'u',
-        'ǯ': 'j',
-        'ǳ': 'ti',
-        'ǵ': 'ni',
-        'Ǭ': 'ch',
-        'ǽ': 'mi',
-        'Ǯ': 'j',
-        'Ƕ': 'n',
-        'Ƿ': 'p',
-        'Ĳ': 'n',
-        'ĵ': 'bh',
-        'ķ': 'y',
-        'Ĺ': 'l',
-        'Ľ': 's',
-        'ĭ': 'dh',
-        'İ': 'd',
-        'ı': 'dh',
-        'Ĩ': 'ch',
-        'ĩ': 'ch',
-        'Ħ': 'g',
-        'ȇ': 'vi',
-        'Ȁ': 'm',
-        'Ȃ': 'y',
-        'ȃ': 'l',
-        'Ȅ': 'l',
-        'ȅ': 'l',
-        'Ȇ': 'l',
-        'ȏ': 'h',
-        'Ȏ': 's',
-        'ț': 'h',
-        'Ț': 't',
-        'Ĵ': 'ph',
-        'ǹ': 'bh',
-        'Ǹ': 'ph',
-        'ǻ': 'bh',
-        'Ǻ': 'b',
-        'Ǽ': 'bh',
-        'Ǿ': 'm',
-        'ǿ': 'm',
-        'Ȉ': 'v',
-        'Ȋ': 'sh',
-        'ȋ': 'sh',
-        'Ȍ': 'sh',
-        'Ȉ': 'v',
-        
-        # Special characters
-        'ṁ': 'm', 'm̐': 'm', 'ṅ': 'ng', 'n̄': 'n',
-        'ḍ': 'd', 'ṭ': 't', 'ḷ': 'l', 'ṛ': 'r',
-        'ś': 'sh', 'ṣ': 'sh',
-    }
-    
-    result = text
-    
-    # Apply mappings
-    for old_char, new_char in mappings.items():
-        result = result.replace(old_char, new_char)
-    
-    # Remove any remaining diacritical marks using Unicode normalization
-    import unicodedata
-    result = ''.join(c for c in unicodedata.normalize('NFD', result) 
-                     if unicodedata.category(c) != 'Mn')
-    
-    # Remove any remaining special characters, keep only letters and spaces
-    result = re.sub(r'[^a-zA-Z\s]', '', result)
-    
-    # Convert to lowercase and clean up spaces
-    result = result.lower().strip()
-    
-    return result
+    if not text.isascii():
+        text = _SEQUENCE_RE.sub(lambda m: _SEQUENCES[m.group()], text)
+    return text.translate(_TABLE).strip()
+
+class PhoneticCache:
+    """
+    Bounded LRU cache around simplify_phonetic
+    Tracks hits, misses and evictions, and can be saved to / loaded from disk
+    """
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __call__(self, text):
+        return self.simplify(text)
+
+    def simplify(self, text):
+        """Return simplify_phonetic(text), reusing earlier results"""
+        entries = self._entries
+        try:
+            result = entries[text]
+        except KeyError:
+            self.misses += 1
+            result = simplify_phonetic(text)
+            self._store(text, result)
+            return result
+        self.hits += 1
+        entries.move_to_end(text)
+        return result
+
+    def simplify_many(self, texts, convert_many):
+        """
+        Return simplify_phonetic for each of texts, counting hits and
+        misses as simplify() would; the distinct misses are converted in
+        one convert_many(list) call, e.g. on a process pool
+        """
+        entries = self._entries
+        missing = list(dict.fromkeys(text for text in texts if text not in entries))
+        converted = dict(zip(missing, convert_many(missing))) if missing else {}
+        results = []
+        for text in texts:
+            try:
+                result = entries[text]
+            except KeyError:
+                self.misses += 1
+                result = converted[text] if text in converted else simplify_phonetic(text)
+                self._store(text, result)
+            else:
+                self.hits += 1
+                entries.move_to_end(text)
+            results.append(result)
+        return results
+
+    def _store(self, text, result):
+        entries = self._entries
+        entries[text] = result
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, path):
+        """Write the cached entries to a JSON file, least recently used first"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(list(self._entries.items()), f, ensure_ascii=False)
+
+    def load(self, path):
+        """
+        Warm the cache from a file written by save()
+        Returns the number of entries loaded
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            items = json.load(f)
+        for text, result in items[-self.maxsize:]:
+            self._store(text, result)
+        return len(self._entries)
 
-def simplify_dictionary(input_file, output_file):
-    """Convert entire dictionary to simplified phonetics"""
+# Below this many strings a process pool costs more than it saves
+PARALLEL_THRESHOLD = 20000
+BATCH_CHUNK_SIZE = 2000
+
+def _simplify_chunk(texts):
+    return [simplify_phonetic(text) for text in texts]
+
+def _chunks(items, size):
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _map_chunks(pool, texts, chunk_size):
+    results = []
+    for part in pool.map(_simplify_chunk, _chunks(texts, chunk_size)):
+        results.extend(part)
+    return results
+
+def simplify_batch(texts, workers=None, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Simplify many strings across a process pool
+    Results come back in input order; small inputs or workers=1 run
+    sequentially in this process
+    """
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(texts) < PARALLEL_THRESHOLD:
+        return _simplify_chunk(texts)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _map_chunks(pool, texts, chunk_size)
+
+def simplify_dictionary(input_file, output_file, cache=None, workers=1):
+    """
+    Convert entire dictionary to simplified phonetics
+    Pass a PhoneticCache to reuse results for repeated phonetic forms,
+    and workers > 1 to spread the cache misses across a process pool
+    """
+    convert = simplify_phonetic if cache is None else cache.simplify
     
     print(f"Loading dictionary from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        dictionary = json.load(f)
+    with instrumentation.stage('load'):
+        with open(input_file, 'r', encoding='utf-8') as f:
+            dictionary = json.load(f)
+    instrumentation.count('rows_read', len(dictionary))
     
     print(f"Original entries: {len(dictionary)}")
     
-    # Simplify all values
-    simplified = {}
-    for english, phonetic in dictionary.items():
-        simple = simplify_phonetic(phonetic)
-        if simple:  # Only add if not empty after simplification
-            simplified[english] = simple
+    with instrumentation.stage('simplify'):
+        if workers != 1:
+            # Each distinct phonetic form not already cached is converted
+            # once, in parallel
+            phonetics = list(dictionary.values())
+
+            def convert_many(texts):
+                return simplify_batch(texts, workers)
+
+            if cache is None:
+                unique = list(dict.fromkeys(phonetics))
+                results = dict(zip(unique, convert_many(unique)))
+                simple_values = [results[phonetic] for phonetic in phonetics]
+                instrumentation.count('transliterations', len(unique))
+            else:
+                simple_values = cache.simplify_many(phonetics, convert_many)
+            pairs = zip(dictionary, simple_values)
+        else:
+            if cache is None:
+                instrumentation.count('transliterations', len(dictionary))
+            pairs = ((english, convert(phonetic)) for english, phonetic in dictionary.items())
+        
+        # Only add if not empty after simplification
+        simplified = {english: simple for english, simple in pairs if simple}
     
     print(f"Simplified entries: {len(simplified)}")
+    if cache is not None:
+        stats = cache.stats()
+        print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} evictions ({stats['hit_rate']:.0%} hit rate)")
     
     # Save simplified dictionary
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(simplified, f, ensure_ascii=True, indent=2)
+    with instrumentation.stage('save'):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(simplified, f, ensure_ascii=True, indent=2)
+    instrumentation.count('records_written', len(simplified))
+    instrumentation.count('bytes_out', os.path.getsize(output_file))
     
     print(f"\n✅ Saved simplified dictionary to {output_file}")
     
@@ -136,10 +324,280 @@ def simplify_dictionary(input_file, output_file):
     
     return simplified
 
+_MISSING = object()
+
+# Characters that can follow a complete JSON value
+_JSON_DELIMITERS = frozenset(' \t\r\n,:]}')
+
+def _iter_json_values(f, container, chunk_size=65536):
+    """
+    Yield the values inside a top-level JSON object or array one at a
+    time, without loading the whole file; container is '{' or '['.
+    Object keys come out as values too, alternating with their values
+    """
+    decoder = json.JSONDecoder()
+    close = '}' if container == '{' else ']'
+    buf = ''
+    pos = 0
+    eof = False
+    started = False
+
+    while True:
+        # Skip whitespace and structural characters between tokens
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf, pos = f.read(chunk_size), 0
+            eof = not buf
+        if pos >= len(buf):
+            raise ValueError("Unexpected end of JSON input")
+
+        char = buf[pos]
+        if not started:
+            if char != container:
+                kind = 'object' if container == '{' else 'array'
+                raise ValueError(f"Expected a JSON {kind}")
+            pos += 1
+            started = True
+            continue
+        if char == close:
+            return
+        if char in ',:':
+            pos += 1
+            continue
+
+        # Decode one complete value, reading more input until it fits.
+        # A number cut at the end of the buffer decodes without error
+        # ("1500" of "15000000000.0"), so a value only counts once a
+        # delimiter follows it or the input has ended
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                if eof or (end < len(buf) and buf[end] in _JSON_DELIMITERS):
+                    break
+            more = f.read(chunk_size)
+            eof = not more
+            buf, pos = buf[pos:] + more, 0
+        pos = end
+        yield value
+
+def _iter_json_object(f, chunk_size=65536):
+    """
+    Yield (key, value) pairs from a top-level JSON object one at a time,
+    without loading the whole file
+    """
+    values = _iter_json_values(f, '{', chunk_size)
+    for key in values:
+        value = next(values, _MISSING)
+        if value is _MISSING:
+            raise ValueError(f"Missing value for key {key!r}")
+        yield key, value
+
+def iter_json_array(f, chunk_size=65536):
+    """Yield the items of a top-level JSON array one at a time"""
+    return _iter_json_values(f, '[', chunk_size)
+
+def iter_entries(input_file):
+    """
+    Yield (english, phonetic) pairs from a dictionary file one at a time
+    Supports a JSON object, JSONL objects and dictionary_master_english.csv
+    """
+    ext = os.path.splitext(input_file)[1].lower()
+    with open(input_file, 'r', encoding='utf-8', newline='') as f:
+        if ext == '.csv':
+            for row in csv.DictReader(f):
+                yield row['english'], row['phonetics']
+        elif ext == '.jsonl':
+            for line in f:
+                if line.strip():
+                    yield from json.loads(line).items()
+        else:
+            yield from _iter_json_object(f)
+
+def _iter_simplified(entries, cache, workers, chunk_size):
+    """
+    Yield (english, simplified) pairs, converting windows in parallel
+    Inputs shorter than PARALLEL_THRESHOLD run sequentially; with a
+    cache, only the window's cache misses go to the pool
+    """
+    convert = simplify_phonetic if cache is None else cache.simplify
+    if workers > 1:
+        head = list(islice(entries, PARALLEL_THRESHOLD))
+        if len(head) < PARALLEL_THRESHOLD:
+            workers = 1
+        entries = chain(head, entries)
+    if workers <= 1:
+        for english, phonetic in entries:
+            yield english, convert(phonetic)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        def convert_many(texts):
+            return _map_chunks(pool, texts, chunk_size)
+
+        for window in _chunks(entries, chunk_size * workers):
+            phonetics = [phonetic for _, phonetic in window]
+            if cache is None:
+                results = convert_many(phonetics)
+            else:
+                results = cache.simplify_many(phonetics, convert_many)
+            for (english, _), simple in zip(window, results):
+                yield english, simple
+
+def simplify_stream(input_file, output_file, cache=None, workers=1,
+                    chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Convert a dictionary entry by entry, writing each result as it goes
+    Output is JSONL or CSV depending on the output file extension;
+    memory use does not grow with the input size. With workers > 1 and
+    at least PARALLEL_THRESHOLD entries, windows of workers * chunk_size
+    entries are converted in parallel, skipping strings already cached
+    """
+    workers = workers or os.cpu_count() or 1
+    as_csv = os.path.splitext(output_file)[1].lower() == '.csv'
+    read = written = 0
+
+    print(f"Streaming dictionary from {input_file}...")
+    with instrumentation.stage('stream'), \
+            open(output_file, 'w', encoding='utf-8', newline='') as out:
+        if as_csv:
+            writer = csv.writer(out)
+            writer.writerow(['english', 'banjara_english'])
+        entries = iter_entries(input_file)
+        for english, simple in _iter_simplified(entries, cache, workers, chunk_size):
+            read += 1
+            if not simple:
+                continue
+            if as_csv:
+                writer.writerow([english, simple])
+            else:
+                out.write(json.dumps({english: simple}, ensure_ascii=True) + '\n')
+            written += 1
+    instrumentation.count('rows_read', read)
+    if cache is None:
+        instrumentation.count('transliterations', read)
+    instrumentation.count('records_written', written)
+    instrumentation.count('bytes_out', os.path.getsize(output_file))
+
+    print(f"Original entries: {read}")
+    print(f"Simplified entries: {written}")
+    print(f"\n✅ Saved simplified dictionary to {output_file}")
+    return written
+
+MANIFEST_VERSION = 1
+
+def _row_hash(english, phonetic):
+    return hashlib.sha1(f"{english}\x1f{phonetic}".encode('utf-8')).hexdigest()
+
+def simplify_incremental(input_file, output_file, manifest_file=None, cache=None):
+    """
+    Rebuild the simplified dictionary from dictionary_master_english.csv,
+    re-transliterating only rows whose content changed since the last run
+    A sidecar manifest keyed by serial stores each row's hash and result
+    Returns row counts plus 'entries', the number of simplified entries
+    """
+    manifest_file = manifest_file or output_file + '.manifest.json'
+    convert = simplify_phonetic if cache is None else cache.simplify
+
+    previous = {}
+    if os.path.exists(manifest_file) and os.path.exists(output_file):
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            previous = manifest['rows']
+
+    rows = {}
+    added = changed = 0
+    with instrumentation.stage('diff'), open(input_file, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            serial, english, phonetic = row['serial'], row['english'], row['phonetics']
+            digest = _row_hash(english, phonetic)
+            old = previous.get(serial)
+            if old is not None and old[0] == digest:
+                rows[serial] = old
+                continue
+            if old is None:
+                added += 1
+            else:
+                changed += 1
+            rows[serial] = [digest, english, convert(phonetic)]
+    deleted = sum(1 for serial in previous if serial not in rows)
+    instrumentation.count('rows_read', len(rows))
+    if cache is None:
+        instrumentation.count('transliterations', added + changed)
+
+    simplified = {}
+    for _, english, simple in rows.values():
+        if simple:  # Only add if not empty after simplification
+            simplified[english] = simple
+
+    stats = {'added': added, 'changed': changed, 'deleted': deleted,
+             'unchanged': len(rows) - added - changed, 'entries': len(simplified)}
+    print(f"Rows: {stats['added']} added, {stats['changed']} changed, "
+          f"{stats['deleted']} deleted, {stats['unchanged']} unchanged")
+    if not (added or changed or deleted):
+        print("\n✅ Simplified dictionary is up to date")
+        return stats
+
+    with instrumentation.stage('save'):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(simplified, f, ensure_ascii=True, indent=2)
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'rows': rows}, f, ensure_ascii=False)
+    instrumentation.count('records_written', len(simplified))
+    instrumentation.count('bytes_out', os.path.getsize(output_file))
+
+    print(f"\n✅ Saved simplified dictionary to {output_file}")
+    return stats
+
 if __name__ == "__main__":
-    input_path = r"i:\Banjara AI\dictionary.json"
-    output_path = r"i:\Banjara AI\dictionary_simplified.json"
+    parser = argparse.ArgumentParser(description="Simplify phonetic transliterations")
+    parser.add_argument('input', nargs='?', default=r"i:\Banjara AI\dictionary.json")
+    parser.add_argument('output', nargs='?', default=r"i:\Banjara AI\dictionary_simplified.json")
+    parser.add_argument('--cache', metavar='FILE',
+                        help="phonetic cache file to warm from and save to (default: not saved)")
+    parser.add_argument('--cache-size', type=int, default=65536,
+                        help="most phonetic forms kept in the cache")
+    parser.add_argument('--stream', action='store_true',
+                        help="convert entry by entry and write JSONL/CSV output")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only re-transliterate CSV rows changed since the last run "
+                        "(input must be the dictionary CSV)")
+    parser.add_argument('--manifest', help="row-hash manifest for --incremental "
+                        "(default: OUTPUT.manifest.json)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for transliteration (0 = all cores)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+    if args.incremental and not args.input.lower().endswith('.csv'):
+        parser.error("--incremental reads dictionary_master_english.csv; pass the CSV as input")
     
-    simplified_dict = simplify_dictionary(input_path, output_path)
+    with instrumentation.run('simplify_phonetics', args.metrics, args.profile):
+        cache = PhoneticCache(args.cache_size)
+        if args.cache and os.path.exists(args.cache):
+            with instrumentation.stage('cache_load'):
+                print(f"Warm cache: {cache.load(args.cache)} entries")
+        
+        if args.incremental:
+            stats = simplify_incremental(args.input, args.output, args.manifest, cache=cache)
+            count = stats['entries']
+        elif args.stream:
+            count = simplify_stream(args.input, args.output, cache=cache,
+                                    workers=args.workers)
+        else:
+            count = len(simplify_dictionary(args.input, args.output, cache=cache,
+                                            workers=args.workers))
+        if args.cache:
+            with instrumentation.stage('cache_save'):
+                cache.save(args.cache)
+        # With the cache, transliterate calls are the cache misses
+        instrumentation.count('transliterations', cache.misses)
+        instrumentation.count('cache_hits', cache.hits)
+        instrumentation.count('cache_misses', cache.misses)
     
-    print(f"\n✨ Done! Created simplified dictionary with {len(simplified_dict)} entries")
+    print(f"\n✨ Done! Created simplified dictionary with {count} entries")
@@ -0,0 +1,60 @@
+"""
+Streaming JSON reader test
+_iter_json_object and iter_json_array must yield what json.loads does
+for the same text at any chunk size, including numbers, literals and
+strings that split across chunk boundaries.
+"""
+
+import io
+import json
+import unittest
+
+from simplify_phonetics import _iter_json_object, iter_json_array
+
+CHUNK_SIZES = (1, 2, 3, 5, 11, 65536)
+
+VALUES = [
+    15000000000.0, -1.5e-7, 1e300, 2.5E+10, -0.0, 0, 123456789012345678901234567890,
+    "ba:t", "quote \" and \\ backslash", "unicode हि", "",
+    True, False, None, [], {}, [1.25e-3, [2, {"x": 3e3}]], {"a": {"b": [None, -4.5e12]}},
+]
+
+class JsonStreamTest(unittest.TestCase):
+
+    def check_array(self, text):
+        expected = json.loads(text)
+        for size in CHUNK_SIZES:
+            with self.subTest(chunk_size=size):
+                self.assertEqual(list(iter_json_array(io.StringIO(text), size)), expected)
+
+    def check_object(self, text):
+        expected = list(json.loads(text).items())
+        for size in CHUNK_SIZES:
+            with self.subTest(chunk_size=size):
+                self.assertEqual(list(_iter_json_object(io.StringIO(text), size)), expected)
+
+    def test_array_compact(self):
+        self.check_array(json.dumps(VALUES, separators=(',', ':')))
+
+    def test_array_indented(self):
+        self.check_array(json.dumps(VALUES, indent=2))
+
+    def test_object_compact(self):
+        obj = {f"k{i}": value for i, value in enumerate(VALUES)}
+        self.check_object(json.dumps(obj, separators=(',', ':'), ensure_ascii=False))
+
+    def test_object_indented(self):
+        obj = {f"k{i}": value for i, value in enumerate(VALUES)}
+        self.check_object(json.dumps(obj, indent=2))
+
+    def test_empty(self):
+        self.check_array('[]')
+        self.check_array(' [ ] ')
+        self.check_object('{}')
+
+    def test_missing_value(self):
+        with self.assertRaises(ValueError):
+            list(_iter_json_object(io.StringIO('{"a": 1, "b"}'), 2))
+
+if __name__ == "__main__":
+    unittest.main()
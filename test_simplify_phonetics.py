@@ -0,0 +1,36 @@
+"""
+Golden-output test for simplify_phonetic
+simplify_phonetics_golden.json holds the output of the original
+per-call implementation for every distinct phonetics cell in
+dictionary_master_english.csv; the table-driven version must match it.
+"""
+
+import csv
+import json
+import unittest
+
+from simplify_phonetics import simplify_phonetic
+
+CSV_FILE = 'dictionary_master_english.csv'
+GOLDEN_FILE = 'simplify_phonetics_golden.json'
+
+class SimplifyPhoneticGoldenTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(GOLDEN_FILE, 'r', encoding='utf-8') as f:
+            cls.golden = json.load(f)
+        with open(CSV_FILE, 'r', encoding='utf-8', newline='') as f:
+            cls.cells = [row['phonetics'] for row in csv.DictReader(f)]
+
+    def test_every_phonetics_cell(self):
+        mismatches = []
+        for i, cell in enumerate(self.cells, start=2):
+            self.assertIn(cell, self.golden, f"CSV line {i} has no golden output")
+            result = simplify_phonetic(cell)
+            if result != self.golden[cell]:
+                mismatches.append((i, cell, self.golden[cell], result))
+        self.assertEqual(mismatches, [])
+
+if __name__ == "__main__":
+    unittest.main()
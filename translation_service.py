@@ -0,0 +1,334 @@
+"""
+Banjara Translation Service
+Asyncio HTTP service around the dictionary index and translator.
+Concurrent single-sentence requests are micro-batched into one pass over
+the shared in-memory index; /translate/batch takes whole corpora.
+
+Endpoints:
+  GET  /health
+  GET  /translate?text=...
+  POST /translate          {"text": "..."}
+  POST /translate/batch    {"sentences": ["...", ...]} or a sentences_10k.json list
+  GET  /speak?text=...     translated speech, streamed as chunked WAV
+  POST /speak              {"text": "..."} or {"banjara": "..."}, "format": "wav" | "pcm"
+/speak lists words without a clip in X-Missing-Words, percent-encoded.
+"""
+
+import argparse
+import asyncio
+import json
+from collections import namedtuple
+from urllib.parse import parse_qs, quote, urlsplit
+
+import instrumentation
+from translator import TranslationCache, Translator
+
+# Sentences translated between yields to the event loop in batch requests
+BATCH_CHUNK = 1000
+
+# Handler payload sent with chunked transfer encoding instead of as JSON
+Stream = namedtuple('Stream', 'content_type headers chunks')
+
+def translation_json(result):
+    """JSON-ready form of a Translation"""
+    return {
+        'translation': result.text,
+        'found': result.found,
+        'total': result.total,
+        'coverage': result.coverage,
+    }
+
+class MicroBatcher:
+    """
+    Collects items submitted by concurrent requests and processes them
+    together with one call to fn(items) -> results
+    """
+
+    def __init__(self, fn, max_batch=256, max_delay=0.0):
+        self.fn = fn
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.items = 0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, item):
+        """Queue one item and wait for its result"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    def _drain(self, batch):
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            # Give other ready connections a chance to queue their items
+            await asyncio.sleep(self.max_delay)
+            self._drain(batch)
+
+            try:
+                results = self.fn([item for item, _ in batch])
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            self.batches += 1
+            self.items += len(batch)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+class TranslationService:
+    """HTTP/1.1 keep-alive server dispatching to a shared Translator"""
+
+    def __init__(self, translator, max_batch=256, max_delay=0.0, cache=None, synthesizer=None):
+        self.translator = translator
+        self.cache = cache
+        self.synthesizer = synthesizer
+        self.batcher = MicroBatcher(self._translate_many, max_batch, max_delay)
+        self.routes = {
+            ('GET', '/health'): self.health,
+            ('GET', '/translate'): self.translate,
+            ('POST', '/translate'): self.translate,
+            ('POST', '/translate/batch'): self.translate_batch,
+            ('GET', '/speak'): self.speak,
+            ('POST', '/speak'): self.speak,
+        }
+
+    def _translate_many(self, texts):
+        translate = self.translator.translate if self.cache is None else self.cache.translate
+        instrumentation.count('sentences', len(texts))
+        with instrumentation.stage('translate_batch'):
+            return [translate(text) for text in texts]
+
+    # Handlers return (status, JSON payload)
+
+    async def health(self, query, body):
+        translator = self.translator if self.cache is None else self.cache.translator
+        payload = {
+            'status': 'ok',
+            'words': len(translator.index),
+            'phrases': len(translator.matcher),
+            'batches': self.batcher.batches,
+            'batched_requests': self.batcher.items,
+        }
+        if self.cache is not None:
+            payload['cache'] = self.cache.stats()
+        return 200, payload
+
+    async def translate(self, query, body):
+        text = query.get('text', [None])[0]
+        if text is None and body:
+            data = json.loads(body)
+            if not isinstance(data, dict):
+                return 400, {'error': "Expected a JSON object"}
+            text = data.get('text')
+        if not isinstance(text, str):
+            return 400, {'error': "Expected a 'text' string"}
+        result = await self.batcher.submit(text)
+        return 200, translation_json(result)
+
+    async def translate_batch(self, query, body):
+        data = json.loads(body or b'null')
+        if isinstance(data, dict):
+            data = data.get('sentences')
+        if not isinstance(data, list):
+            return 400, {'error': "Expected a list of sentences"}
+        texts = [item['text'] if isinstance(item, dict) else item for item in data]
+        if not all(isinstance(text, str) for text in texts):
+            return 400, {'error': "Sentences must be strings or objects with 'text'"}
+
+        results = []
+        for start in range(0, len(texts), BATCH_CHUNK):
+            chunk = self._translate_many(texts[start:start + BATCH_CHUNK])
+            results.extend(translation_json(result) for result in chunk)
+            await asyncio.sleep(0)
+        return 200, {'results': results}
+
+    async def speak(self, query, body):
+        if self.synthesizer is None:
+            return 404, {'error': 'Speech is not enabled (start with --clips)'}
+        if not len(self.synthesizer.library):
+            return 404, {'error': 'No clips in the TTS library'}
+        params = {name: values[0] for name, values in query.items()}
+        if body:
+            data = json.loads(body)
+            if not isinstance(data, dict):
+                return 400, {'error': "Expected a JSON object"}
+            params.update(data)
+        banjara = params.get('banjara')
+        if banjara is None:
+            text = params.get('text')
+            if not isinstance(text, str):
+                return 400, {'error': "Expected a 'text' or 'banjara' string"}
+            banjara = (await self.batcher.submit(text)).text
+        if not isinstance(banjara, str):
+            return 400, {'error': "Expected a 'banjara' string"}
+
+        pcm = params.get('format') == 'pcm'
+        speech = self.synthesizer.stream(banjara, header=not pcm)
+        channels, width, rate = self.synthesizer.library.params
+        # Header values are latin-1; missing words may not be, so they are
+        # percent-encoded UTF-8 (decodeURIComponent on the client)
+        headers = {'X-Missing-Words': quote(' '.join(speech.missing))}
+        if pcm:
+            headers.update({'X-Sample-Rate': rate, 'X-Channels': channels,
+                            'X-Sample-Width': width})
+        content_type = 'application/octet-stream' if pcm else 'audio/wav'
+        return 200, Stream(content_type, headers, speech.chunks)
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        if handler is None:
+            known = any(path == url.path for _, path in self.routes)
+            return (405, {'error': 'Method not allowed'}) if known else (404, {'error': 'Not found'})
+        try:
+            return await handler(parse_qs(url.query), body)
+        except (ValueError, KeyError, TypeError) as error:
+            return 400, {'error': str(error)}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length') or 0))
+
+                if method == 'OPTIONS':
+                    status, payload = 204, None
+                else:
+                    status, payload = await self.dispatch(method, target, body)
+                keep_alive = (version == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                if isinstance(payload, Stream):
+                    await _write_stream(writer, payload, keep_alive)
+                else:
+                    writer.write(_response(status, payload, keep_alive))
+                    await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        """Run the service until cancelled"""
+        self.batcher.start()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"🌐 Translation service on http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+_REASONS = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed'}
+
+def _head(status, content_type, extra, keep_alive):
+    headers = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}",
+        f"Content-Type: {content_type}",
+        *(f"{name}: {value}" for name, value in extra.items()),
+        "Access-Control-Allow-Origin: *",
+        "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+        "Access-Control-Allow-Headers: Content-Type",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    return ('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1')
+
+def _response(status, payload, keep_alive):
+    body = b'' if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    return _head(status, "application/json; charset=utf-8",
+                 {'Content-Length': len(body)}, keep_alive) + body
+
+async def _write_stream(writer, stream, keep_alive):
+    """
+    Send a Stream with chunked transfer encoding, waiting for each chunk
+    to drain so at most one chunk is buffered per connection
+    """
+    extra = dict(stream.headers, **{'Transfer-Encoding': 'chunked'})
+    writer.write(_head(200, stream.content_type, extra, keep_alive))
+    for chunk in stream.chunks:
+        writer.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+        await writer.drain()
+    writer.write(b'0\r\n\r\n')
+    await writer.drain()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Banjara translations over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--csv', default='dictionary_master_english.csv')
+    parser.add_argument('--max-batch', type=int, default=256,
+                        help="most single-sentence requests translated in one pass")
+    parser.add_argument('--max-delay', type=float, default=0.0,
+                        help="seconds to wait for more requests before each pass")
+    parser.add_argument('--cache-size', type=int, default=10000,
+                        help="cached translations (0 disables the cache)")
+    parser.add_argument('--cache-ttl', type=float, default=3600.0,
+                        help="seconds a cached translation stays valid")
+    parser.add_argument('--clips', help="TTS library root (the folder holding dictionary/, "
+                        "pages/ and numbers/) or audio bank; enables /speak")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    # Metrics are written when the service shuts down
+    with instrumentation.run('translation_service', args.metrics, args.profile):
+        with instrumentation.stage('load'):
+            translator = Translator.from_csv(args.csv)
+        print(f"📚 Loaded {len(translator.index)} words, {len(translator.matcher)} phrases")
+        cache = None
+        if args.cache_size > 0:
+            cache = TranslationCache(translator, args.cache_size, args.cache_ttl,
+                                     csv_file=args.csv)
+        synthesizer = None
+        if args.clips:
+            from banjara_tts import CLIP_DIRS, Synthesizer, get_library
+            synthesizer = Synthesizer(get_library(args.clips))
+            if not len(synthesizer.library):
+                parser.error(f"no clips found in {args.clips}; --clips takes the library "
+                             f"root holding {', '.join(CLIP_DIRS)}")
+            print(f"🔊 Loaded {len(synthesizer.library)} clips")
+        service = TranslationService(translator, args.max_batch, args.max_delay, cache,
+                                     synthesizer)
+        try:
+            asyncio.run(service.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        instrumentation.count('batches', service.batcher.batches)
+        if cache is not None:
+            instrumentation.count('cache_hits', cache.hits)
+            instrumentation.count('cache_misses', cache.misses)
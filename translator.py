@@ -0,0 +1,363 @@
+"""
+Banjara Translator
+Server-side port of the script.js translation logic over
+dictionary_master_english.csv. Phrases and multi-word headwords are
+matched in a single pass over the input tokens with a token trie,
+taking the longest non-overlapping match at each position.
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import OrderedDict, namedtuple
+
+import instrumentation
+from banjara_dictionary import file_hash, load_index, normalize
+from fuzzy_index import FuzzyIndex
+from inflections import build_surface_forms, forms_path, load_surface_forms
+
+# Same phrase table as buildPhraseDictionary in script.js
+PHRASES = {
+    # Greetings
+    'good morning': 'sorer parbati',
+    'good evening': 'sorer sanj',
+    'good night': 'sorer rat',
+    'hello': 'namaste',
+
+    # Common phrases
+    'how are you': 'tum kaise ho',
+    'thank you': 'dhanyavad',
+    'i am fine': 'me theek hun',
+    'very good': 'bahut achchha',
+
+    # Pronouns with auxiliaries
+    'i am': 'me hun',
+    'you are': 'tum ho',
+    'he is': 'vo hai',
+    'she is': 'vo hai',
+    'we are': 'hum hain',
+    'they are': 've hain',
+
+    # Common questions
+    'what is': 'kya hai',
+    'where is': 'kahan hai',
+    'who is': 'kaun hai',
+    'how is': 'kaise hai',
+}
+
+# Grammar rules, same tables as script.js
+GRAMMAR = {
+    'ignore': {'the', 'a', 'an'},
+
+    'pronouns': {
+        'i': 'me', 'you': 'tum', 'he': 'vo', 'she': 'vo',
+        'we': 'hum', 'they': 've', 'it': 'ye',
+        'my': 'mera', 'your': 'tumhara', 'his': 'uska',
+        'her': 'uski', 'our': 'hamara', 'their': 'unka'
+    },
+
+    'auxiliaries': {
+        'am': 'hun', 'is': 'hai', 'are': 'ho',
+        'was': 'tha', 'were': 'the', 'been': 'raha',
+        'will': 'ga', 'would': 'ga', 'can': 'sakta',
+        'should': 'chahiye', 'must': 'zaroor'
+    },
+
+    'prepositions': {
+        'in': 'me', 'on': 'par', 'at': 'pe', 'to': 'ko',
+        'from': 'se', 'with': 'ke saath', 'for': 'ke liye',
+        'of': 'ka', 'by': 'se', 'under': 'niche'
+    },
+}
+
+# One translated piece of the input: source tokens, output text and
+# where it came from ('phrase', 'grammar', 'dictionary', 'inflected', 'fuzzy',
+# 'missing')
+Segment = namedtuple('Segment', 'source translation kind')
+
+class Translation(namedtuple('Translation', 'text found total segments')):
+    """Translated text plus the coverage counts reported by script.js"""
+
+    @property
+    def coverage(self):
+        return round(self.found / self.total * 100) if self.total else 0
+
+    def format(self):
+        """Render like translateWords: text, then an emoji coverage line"""
+        coverage = self.coverage
+        emoji = '🎯' if coverage >= 80 else '📊' if coverage >= 50 else '⚠️'
+        return (f"{self.text}\n\n{emoji} {self.found}/{self.total} words "
+                f"({coverage}% coverage)")
+
+def tokenize(text):
+    """Split text into lowercase tokens with translateWords' punctuation rules"""
+    return normalize(text).split()
+
+class PhraseMatcher:
+    """
+    Token trie over multi-token phrases
+    Matching walks at most max_length tokens from each position, so cost
+    depends on the input length, not on how many phrases are loaded
+    """
+
+    _END = None
+
+    def __init__(self):
+        self._root = {}
+        self._count = 0
+        self.max_length = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, phrase, translation):
+        """Add a phrase; the first translation added for a phrase wins"""
+        tokens = tokenize(phrase)
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if self._END not in node:
+            node[self._END] = translation
+            self._count += 1
+            self.max_length = max(self.max_length, len(tokens))
+
+    def match(self, tokens, start):
+        """Return (length, translation) of the longest phrase at start, or None"""
+        node = self._root
+        best = None
+        for pos in range(start, min(len(tokens), start + self.max_length)):
+            node = node.get(tokens[pos])
+            if node is None:
+                break
+            if self._END in node:
+                best = (pos - start + 1, node[self._END])
+        return best
+
+class Translator:
+    """English to Banjara translation over a DictionaryIndex"""
+
+    def __init__(self, index, phrases=PHRASES, grammar=GRAMMAR, fuzzy=None, forms=None):
+        self.index = index
+        self.fuzzy = fuzzy
+        self.grammar = grammar
+        self.ignore = grammar['ignore']
+        self.forms = build_surface_forms(index, grammar) if forms is None else forms
+        self.matcher = PhraseMatcher()
+        for phrase, translation in phrases.items():
+            self.matcher.add(phrase, translation)
+        for headword in index.headwords():
+            if ' ' in headword:
+                self.matcher.add(headword, index.get(headword))
+
+    @classmethod
+    def from_csv(cls, csv_file='dictionary_master_english.csv', index_file=None,
+                 forms_file=None, fuzzy=False):
+        """
+        Build a translator from the prebuilt dictionary index and
+        surface-form table, both kept next to the CSV by default
+        fuzzy=True falls back to the closest headword for unknown words
+        """
+        index = load_index(csv_file, index_file)
+        forms = load_surface_forms(index, GRAMMAR, forms_file or forms_path(csv_file))
+        return cls(index, fuzzy=FuzzyIndex(index) if fuzzy else None, forms=forms)
+
+    def translate_word(self, word):
+        """Return (translation, kind) for one token, or ('[word]', 'missing')"""
+        # Grammar words, headwords and their inflections: one probe
+        entry = self.forms.get(word)
+        if entry is not None:
+            return entry[0], entry[1]
+
+        # Closest headword for misspellings and variant spellings
+        if self.fuzzy is not None:
+            match = self.fuzzy.lookup(word)
+            if match:
+                return match[1], 'fuzzy'
+        return f"[{word}]", 'missing'
+
+    def translate_tokens(self, tokens):
+        """Translate already-tokenized input"""
+        segments = []
+        found = total = 0
+        pos = 0
+        match = self.matcher.match
+        while pos < len(tokens):
+            phrase = match(tokens, pos)
+            if phrase:
+                length, trans = phrase
+                source = tokens[pos:pos + length]
+                counted = sum(1 for token in source if token not in self.ignore)
+                found += counted
+                total += counted
+                segments.append(Segment(' '.join(source), trans, 'phrase'))
+                pos += length
+                continue
+
+            token = tokens[pos]
+            pos += 1
+            # Skip articles
+            if token in self.ignore:
+                continue
+            total += 1
+            trans, kind = self.translate_word(token)
+            if kind != 'missing':
+                found += 1
+            segments.append(Segment(token, trans, kind))
+
+        text = ' '.join(segment.translation for segment in segments)
+        return Translation(text, found, total, segments)
+
+    def translate(self, text):
+        """Translate English text to Banjara"""
+        return self.translate_tokens(tokenize(text))
+
+class TranslationCache:
+    """
+    LRU + TTL cache in front of a Translator
+    Keys are normalized token sequences, so "How are you?", "how are you"
+    and "How are you ?" share one entry. When csv_file is given, the cache
+    watches it and reloads the translator and drops every entry once the
+    dictionary's hash changes. loader() builds the new translator; pass one
+    when the translator was built with a custom index_file or forms_file,
+    otherwise it is rebuilt from csv_file with the same fuzzy setting.
+    """
+
+    def __init__(self, translator, maxsize=10000, ttl=3600.0, csv_file=None,
+                 check_interval=5.0, clock=time.monotonic, loader=None):
+        self.translator = translator
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.csv_file = csv_file
+        if loader is None and csv_file:
+            fuzzy = translator.fuzzy is not None
+            loader = lambda: Translator.from_csv(csv_file, fuzzy=fuzzy)
+        self.loader = loader
+        self.check_interval = check_interval
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._next_check = clock() + check_interval
+        self._csv_stat = self._stat()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _stat(self):
+        if not self.csv_file:
+            return None
+        stat = os.stat(self.csv_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def check_version(self):
+        """
+        Reload the translator and clear the cache if the dictionary changed
+        Returns True when the cache was invalidated
+        """
+        if not self.csv_file:
+            return False
+        stat = self._stat()
+        if stat == self._csv_stat:
+            return False
+        self._csv_stat = stat
+        if file_hash(self.csv_file) == self.translator.index.version:
+            return False
+        self.translator = self.loader()
+        self._entries.clear()
+        self.invalidations += 1
+        return True
+
+    def translate(self, text):
+        """Translate text, reusing a cached result for the same tokens"""
+        now = self.clock()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            self.check_version()
+
+        key = tuple(tokenize(text))
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None:
+            expires, result = entry
+            if expires > now:
+                self.hits += 1
+                entries.move_to_end(key)
+                return result
+            del entries[key]
+            self.expirations += 1
+
+        self.misses += 1
+        result = self.translator.translate_tokens(list(key))
+        entries[key] = (now + self.ttl, result)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+        self.expirations = self.invalidations = 0
+
+    def stats(self):
+        """Return hit/miss/eviction/expiry counters and the current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'dictionary_version': self.translator.index.version,
+        }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Translate English to Banjara")
+    parser.add_argument('text', nargs='*', help="English text to translate")
+    parser.add_argument('--csv', default='dictionary_master_english.csv')
+    parser.add_argument('--fuzzy', action='store_true',
+                        help="translate unknown words with the closest headword")
+    parser.add_argument('--corpus', help="translate every sentence in a JSON/JSONL corpus "
+                        "and report coverage and throughput")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    with instrumentation.run('translator', args.metrics, args.profile):
+        with instrumentation.stage('load'):
+            translator = Translator.from_csv(args.csv, fuzzy=args.fuzzy)
+        print(f"📚 Loaded {len(translator.index)} words")
+        print(f"💬 Built {len(translator.matcher)} phrases")
+
+        if args.text:
+            print(translator.translate(' '.join(args.text)).format())
+
+        if args.corpus:
+            with instrumentation.stage('read_corpus'):
+                with open(args.corpus, 'r', encoding='utf-8') as f:
+                    if args.corpus.endswith('.jsonl'):
+                        sentences = [json.loads(line)['text'] for line in f if line.strip()]
+                    else:
+                        sentences = [record['text'] for record in json.load(f)]
+            start = time.perf_counter()
+            with instrumentation.stage('translate'):
+                results = [translator.translate(sentence) for sentence in sentences]
+            elapsed = time.perf_counter() - start
+            found = sum(result.found for result in results)
+            total = sum(result.total for result in results)
+            instrumentation.count('sentences', len(results))
+            instrumentation.count('words', total)
+            instrumentation.count('words_found', found)
+            print(f"\n✅ Translated {len(results)} sentences in {elapsed * 1000:.1f} ms "
+                  f"({len(results) / elapsed:,.0f}/s)")
+            print(f"   {found}/{total} words "
+                  f"({round(found / total * 100) if total else 0}% coverage)")